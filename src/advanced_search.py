@@ -1,12 +1,16 @@
 """Advanced search engine with regex support, history, and search options."""
 
+import functools
 import re
+from collections import OrderedDict, defaultdict
 from typing import List, Optional, Tuple, Dict
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from src.line_index import LineIndex
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Represents a single search result."""
 
@@ -17,30 +21,18 @@ class SearchResult:
     match_text: str  # The matched text
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchQuery:
-    """Represents a search query with options."""
+    """Represents a search query with options.
+
+    Equality and hashing consider only the pattern and options, not the timestamp.
+    """
 
     pattern: str
     case_sensitive: bool = False
     whole_words: bool = False
     regex: bool = False
-    timestamp: datetime = field(default_factory=datetime.now)
-
-    def __hash__(self) -> int:
-        """Make SearchQuery hashable for use in sets/dicts."""
-        return hash((self.pattern, self.case_sensitive, self.whole_words, self.regex))
-
-    def __eq__(self, other: object) -> bool:
-        """Compare queries."""
-        if not isinstance(other, SearchQuery):
-            return NotImplemented
-        return (
-            self.pattern == other.pattern
-            and self.case_sensitive == other.case_sensitive
-            and self.whole_words == other.whole_words
-            and self.regex == other.regex
-        )
+    timestamp: datetime = field(default_factory=datetime.now, compare=False)
 
 
 class AdvancedSearchEngine:
@@ -53,9 +45,11 @@ class AdvancedSearchEngine:
             max_history: Maximum number of search queries to keep in history
         """
         self.max_history = max_history
-        self.search_history: List[SearchQuery] = []
+        # Most recent first; values are unused, keys give O(1) dedup and reordering
+        self.search_history: "OrderedDict[SearchQuery, None]" = OrderedDict()
         self.last_results: List[SearchResult] = []
         self.current_result_index: int = -1
+        self._line_index: Optional[LineIndex] = None
 
     def search(self, text: str, query: SearchQuery) -> List[SearchResult]:
         """Search for pattern in text.
@@ -95,49 +89,42 @@ class AdvancedSearchEngine:
         Returns:
             List of search results
         """
-        pattern = query.pattern
+        if query.case_sensitive and not query.whole_words:
+            # Plain substring: str.find's fast search skips ahead faster than sre
+            return self._find_literal(text, query.pattern)
 
-        if not query.case_sensitive:
-            pattern = pattern.lower()
-            text_search = text.lower()
-        else:
-            text_search = text
-
-        results = []
-        start = 0
-
-        while True:
-            pos = text_search.find(pattern, start)
-            if pos == -1:
-                break
-
-            # Check whole words requirement
-            if query.whole_words:
-                if not self._is_whole_word(text, pos, len(pattern)):
-                    start = pos + 1
-                    continue
-
-            # Get line and column info
-            line_num = text[:pos].count("\n")
-            line_start = text.rfind("\n", 0, pos) + 1
-            column = pos - line_start
-
-            # Get matched text from original
-            match_text = text[pos : pos + len(pattern)]
-
-            results.append(
-                SearchResult(
-                    start=pos,
-                    end=pos + len(pattern),
-                    line_num=line_num,
-                    column=column,
-                    match_text=match_text,
-                )
-            )
+        return self._run_regex(text, self._compile_query(query))
 
-            start = pos + 1
+    def _find_literal(self, text: str, pattern: str) -> List[SearchResult]:
+        """Collect non-overlapping occurrences of a case-sensitive substring.
 
-        return results
+        Args:
+            text: The text to search in
+            pattern: The substring to find
+
+        Returns:
+            List of search results
+        """
+        length = len(pattern)
+        positions = []
+
+        pos = text.find(pattern)
+        while pos != -1:
+            positions.append(pos)
+            pos = text.find(pattern, pos + length)
+
+        # Map all match offsets to lines in one forward pass
+        line_cols = self._get_line_index(text).lines_and_columns(positions)
+        return [
+            SearchResult(
+                start=pos,
+                end=pos + length,
+                line_num=line_num,
+                column=column,
+                match_text=pattern,
+            )
+            for pos, (line_num, column) in zip(positions, line_cols)
+        ]
 
     def _regex_search(self, text: str, query: SearchQuery) -> List[SearchResult]:
         """Perform regex search.
@@ -152,60 +139,90 @@ class AdvancedSearchEngine:
         Raises:
             re.error: If regex pattern is invalid
         """
-        results = []
-        flags = 0 if query.case_sensitive else re.IGNORECASE
+        return self._run_regex(text, self._compile_query(query))
+
+    def _compile_query(self, query: SearchQuery) -> re.Pattern:
+        """Get the compiled pattern for a query.
+
+        Args:
+            query: The search query
+
+        Returns:
+            Compiled pattern implementing the query's options
+
+        Raises:
+            re.error: If regex pattern is invalid
+        """
+        return self._compile(query.pattern, query.case_sensitive, query.whole_words, query.regex)
 
-        try:
-            pattern = query.pattern
-            if query.whole_words:
-                pattern = r"\b" + pattern + r"\b"
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _compile(pattern: str, case_sensitive: bool, whole_words: bool, regex_mode: bool) -> re.Pattern:
+        """Compile a search pattern, memoized across searches.
 
-            regex = re.compile(pattern, flags)
+        Args:
+            pattern: The search pattern
+            case_sensitive: Whether matching is case sensitive
+            whole_words: Whether matches must be whole words
+            regex_mode: Whether pattern is a regex rather than literal text
 
-            for match in regex.finditer(text):
-                pos = match.start()
-                line_num = text[:pos].count("\n")
-                line_start = text.rfind("\n", 0, pos) + 1
-                column = pos - line_start
+        Returns:
+            Compiled pattern
 
-                results.append(
-                    SearchResult(
-                        start=match.start(),
-                        end=match.end(),
-                        line_num=line_num,
-                        column=column,
-                        match_text=match.group(),
-                    )
-                )
+        Raises:
+            re.error: If regex pattern is invalid
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
 
-            return results
+        if regex_mode:
+            if whole_words:
+                # Group so alternations are bounded as a whole
+                pattern = r"\b(?:" + pattern + r")\b"
+        else:
+            pattern = re.escape(pattern)
+            if whole_words:
+                # Lookarounds rather than \b so patterns that start or end with
+                # punctuation still require non-word neighbours
+                pattern = r"(?<!\w)" + pattern + r"(?!\w)"
 
-        except re.error:
-            raise
+        return re.compile(pattern, flags)
 
-    def _is_whole_word(self, text: str, pos: int, length: int) -> bool:
-        """Check if text at position is a whole word.
+    def _run_regex(self, text: str, regex: re.Pattern) -> List[SearchResult]:
+        """Collect every match of a compiled pattern as search results.
 
         Args:
-            text: The full text
-            pos: Position to check
-            length: Length of match
+            text: The text to search in
+            regex: The compiled pattern
 
         Returns:
-            True if match is a whole word
+            List of search results
         """
-        # Check character before
-        if pos > 0:
-            if text[pos - 1].isalnum() or text[pos - 1] == "_":
-                return False
+        matches = list(regex.finditer(text))
+        line_cols = self._get_line_index(text).lines_and_columns(match.start() for match in matches)
+
+        return [
+            SearchResult(
+                start=match.start(),
+                end=match.end(),
+                line_num=line_num,
+                column=column,
+                match_text=match.group(),
+            )
+            for match, (line_num, column) in zip(matches, line_cols)
+        ]
 
-        # Check character after
-        end_pos = pos + length
-        if end_pos < len(text):
-            if text[end_pos].isalnum() or text[end_pos] == "_":
-                return False
+    def _get_line_index(self, text: str) -> LineIndex:
+        """Get the newline index for text, reusing the last index if unchanged.
 
-        return True
+        Args:
+            text: The text to index
+
+        Returns:
+            Line index of text
+        """
+        if self._line_index is None or self._line_index.text is not text:
+            self._line_index = LineIndex(text)
+        return self._line_index
 
     def find_next(self, text: str, query: Optional[SearchQuery] = None) -> Optional[SearchResult]:
         """Find next occurrence from current position.
@@ -270,11 +287,15 @@ class AdvancedSearchEngine:
             return text, 0
 
         if replace_all:
-            # Replace all results (from end to start to preserve positions)
-            modified_text = text
-            for result in reversed(results):
-                modified_text = modified_text[: result.start] + replacement + modified_text[result.end :]
-            return modified_text, len(results)
+            # Build the output in one pass from the already-found matches
+            parts = []
+            prev_end = 0
+            for result in results:
+                parts.append(text[prev_end : result.start])
+                parts.append(replacement)
+                prev_end = result.end
+            parts.append(text[prev_end:])
+            return "".join(parts), len(results)
         else:
             # Replace only current result
             if self.current_result_index < 0 or self.current_result_index >= len(results):
@@ -290,14 +311,16 @@ class AdvancedSearchEngine:
         Args:
             query: The search query to add
         """
-        # Remove duplicate if exists
-        self.search_history = [q for q in self.search_history if q != query]
+        # Remove duplicate if exists so the newest query object is kept
+        self.search_history.pop(query, None)
 
         # Add to beginning
-        self.search_history.insert(0, query)
+        self.search_history[query] = None
+        self.search_history.move_to_end(query, last=False)
 
         # Keep only max_history items
-        self.search_history = self.search_history[: self.max_history]
+        while len(self.search_history) > self.max_history:
+            self.search_history.popitem(last=True)
 
     def get_history(self) -> List[SearchQuery]:
         """Get search history.
@@ -305,11 +328,12 @@ class AdvancedSearchEngine:
         Returns:
             List of recent search queries
         """
-        return self.search_history.copy()
+        return list(self.search_history)
 
     def clear_history(self) -> None:
-        """Clear search history."""
-        self.search_history = []
+        """Clear search history and the compiled pattern cache."""
+        self.search_history.clear()
+        self._compile.cache_clear()
 
     def get_history_by_pattern(self, pattern: str) -> List[SearchQuery]:
         """Get search history items matching pattern.
@@ -320,7 +344,8 @@ class AdvancedSearchEngine:
         Returns:
             List of matching search queries
         """
-        return [q for q in self.search_history if pattern.lower() in q.pattern.lower()]
+        pattern = pattern.lower()
+        return [q for q in self.search_history if pattern in q.pattern.lower()]
 
     def highlight_results(self, text: str, results: Optional[List[SearchResult]] = None) -> Dict[int, List[Tuple[int, int]]]:
         """Get highlight regions for search results by line.
@@ -335,15 +360,13 @@ class AdvancedSearchEngine:
         if results is None:
             results = self.last_results
 
-        highlights: Dict[int, List[Tuple[int, int]]] = {}
+        highlights: defaultdict[int, List[Tuple[int, int]]] = defaultdict(list)
 
         for result in results:
-            if result.line_num not in highlights:
-                highlights[result.line_num] = []
-
-            highlights[result.line_num].append((result.column, result.column + len(result.match_text)))
+            column = result.column
+            highlights[result.line_num].append((column, column + (result.end - result.start)))
 
-        return highlights
+        return dict(highlights)
 
     def get_result_count(self) -> int:
         """Get count of results from last search.
@@ -367,3 +390,4 @@ class AdvancedSearchEngine:
         """Reset search state."""
         self.last_results = []
         self.current_result_index = -1
+        self._line_index = None
@@ -1,11 +1,29 @@
 """Code folding support for detecting and managing foldable code regions."""
 
+import bisect
+import itertools
 import re
-from typing import List, Optional, Tuple, Literal
+from typing import List, Optional, Set, Tuple, Literal
 from dataclasses import dataclass
 
+# Line classifier combining the class, function, block and comment patterns of
+# CodeFolder; the named group that matched gives the region kind. It runs over the
+# whole text in MULTILINE mode, so whitespace is [^\S\n] to keep matches on one line.
+_LINE_CLASSIFIER = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<class>(?:class|interface|struct)[^\S\n]+\w+)"
+    r"|(?P<function>(?:def|function|func|void|int|double|string|async[^\S\n]+function)[^\S\n]+\w+[^\S\n]*\()"
+    r"|(?P<block>(?:if|for|while|try|catch|finally|switch|else[^\S\n]+if|else)(?:[^\S\n]|[\(:]))"
+    r"|(?P<comment>#|//|/\*)"
+    r")",
+    re.MULTILINE,
+)
 
-@dataclass
+# Leading whitespace run of every line, matched over the whole text
+_INDENT_RUN = re.compile(r"^[^\S\n]*", re.MULTILINE)
+
+
+@dataclass(init=False)
 class FoldRegion:
     """Represents a foldable code region."""
 
@@ -15,6 +33,36 @@ class FoldRegion:
     region_type: Literal["function", "class", "block", "indent", "comment"]
     is_folded: bool = False
 
+    # Bumped whenever any region's lines change, so CodeFolder can tell that its
+    # line index is out of date without comparing every region
+    _line_changes = 0
+
+    def __init__(
+        self,
+        start_line: int,
+        end_line: int,
+        level: int,
+        region_type: Literal["function", "class", "block", "indent", "comment"],
+        is_folded: bool = False,
+    ):
+        """Initialize the region.
+
+        Fields are stored directly rather than through __setattr__, since a
+        new region cannot be in any CodeFolder index yet.
+        """
+        fields = self.__dict__
+        fields["start_line"] = start_line
+        fields["end_line"] = end_line
+        fields["level"] = level
+        fields["region_type"] = region_type
+        fields["is_folded"] = is_folded
+
+    def __setattr__(self, name, value):
+        """Set an attribute, counting changes to the region's lines."""
+        if name == "start_line" or name == "end_line":
+            FoldRegion._line_changes += 1
+        object.__setattr__(self, name, value)
+
     @property
     def line_count(self) -> int:
         """Get the number of lines in this region."""
@@ -59,6 +107,14 @@ class CodeFolder:
         """Initialize the code folder."""
         self.regions: List[FoldRegion] = []
         self._indentation_levels: List[int] = []
+        self._nonblank_lines: List[bool] = []
+        # Start-sorted index over self.regions for line lookups, rebuilt when the
+        # list or any region's lines change
+        self._indexed_regions: Optional[List[FoldRegion]] = None
+        self._indexed_line_changes = -1
+        self._index_order: List[int] = []
+        self._index_starts: List[int] = []
+        self._max_span = 0
 
     def analyze(self, text: str, language: str = "auto") -> List[FoldRegion]:
         """Analyze text and detect foldable regions.
@@ -72,86 +128,55 @@ class CodeFolder:
         """
         self.regions = []
         self._indentation_levels = []
+        self._nonblank_lines = []
 
         if not text:
             return self.regions
 
-        lines = text.split("\n")
+        # Measure each line's indentation once, without splitting the text into
+        # line strings; the detectors below only index into these
+        text_len = len(text)
+        for match in _INDENT_RUN.finditer(text):
+            end = match.end()
+            self._indentation_levels.append(end - match.start())
+            self._nonblank_lines.append(end < text_len and text[end] != "\n")
 
         # Detect syntax-based regions (functions, classes, blocks)
-        self._detect_syntax_regions(lines)
+        self._detect_syntax_regions(text)
 
         # Detect indentation-based regions
-        self._detect_indent_regions(lines)
+        self._detect_indent_regions()
 
         # Sort regions by start line
         self.regions.sort(key=lambda r: (r.start_line, -r.level))
 
         return self.regions
 
-    def _detect_syntax_regions(self, lines: List[str]) -> None:
+    def _detect_syntax_regions(self, text: str) -> None:
         """Detect function, class, and block regions.
 
         Args:
-            lines: List of code lines
+            text: The code text
         """
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Check for class definition
-            if self.CLASS_PATTERN.search(line):
-                end_line = self._find_block_end(lines, i)
-                if end_line > i:
-                    self.regions.append(
-                        FoldRegion(
-                            start_line=i,
-                            end_line=end_line,
-                            level=0,
-                            region_type="class",
-                        )
-                    )
-                    # Don't skip, continue to detect nested functions
-                    i += 1
-                    continue
-
-            # Check for function definition
-            if self.FUNCTION_PATTERN.search(line):
-                end_line = self._find_block_end(lines, i)
-                if end_line > i:
-                    # Determine level based on indentation
-                    indent = len(line) - len(line.lstrip())
-                    level = 1 if indent == 0 else 2
-                    self.regions.append(
-                        FoldRegion(
-                            start_line=i,
-                            end_line=end_line,
-                            level=level,
-                            region_type="function",
-                        )
-                    )
-                    # Don't skip, continue to detect nested functions
-                    i += 1
-                    continue
-
-            # Check for block statements
-            if self.BLOCK_PATTERN.search(line):
-                end_line = self._find_block_end(lines, i)
-                if end_line > i:
-                    self.regions.append(
-                        FoldRegion(
-                            start_line=i,
-                            end_line=end_line,
-                            level=2,
-                            region_type="block",
-                        )
-                    )
-                    i += 1
-                    continue
+        # Classify every line in one regex pass; Python only runs per region start
+        starts: List[Tuple[int, Optional[str]]] = []  # (line_num, kind)
+        line_num = 0
+        last_pos = 0
+        for match in _LINE_CLASSIFIER.finditer(text):
+            pos = match.start()
+            line_num += text.count("\n", last_pos, pos)
+            last_pos = pos
+            starts.append((line_num, match.lastgroup))
+
+        comment_lines = {i for i, kind in starts if kind == "comment"}
+        skip_until = 0
+
+        for i, kind in starts:
+            if i < skip_until:
+                continue
 
-            # Check for comment blocks
-            if self.COMMENT_PATTERN.search(line):
-                end_line = self._find_comment_end(lines, i)
+            if kind == "comment":
+                end_line = self._find_comment_end(comment_lines, i)
                 if end_line > i:
                     self.regions.append(
                         FoldRegion(
@@ -161,25 +186,42 @@ class CodeFolder:
                             region_type="comment",
                         )
                     )
-                    i = end_line
-                    continue
-
-            i += 1
+                    skip_until = end_line + 1
+                continue
 
-    def _detect_indent_regions(self, lines: List[str]) -> None:
-        """Detect indentation-based folding regions.
+            # Class, function and block regions don't skip ahead, so nested
+            # regions inside them are detected too
+            end_line = self._find_block_end(i)
+            if end_line > i:
+                if kind == "class":
+                    level = 0
+                elif kind == "function":
+                    # Determine level based on indentation
+                    level = 1 if self._indentation_levels[i] == 0 else 2
+                else:
+                    level = 2
+                self.regions.append(
+                    FoldRegion(
+                        start_line=i,
+                        end_line=end_line,
+                        level=level,
+                        region_type=kind,
+                    )
+                )
 
-        Args:
-            lines: List of code lines
-        """
+    def _detect_indent_regions(self) -> None:
+        """Detect indentation-based folding regions."""
         indent_stack: List[Tuple[int, int, int]] = []  # (indent_level, start_line, level)
 
-        for i, line in enumerate(lines):
-            if not line.strip():  # Skip empty lines
+        indents = self._indentation_levels
+        nonblank = self._nonblank_lines
+
+        for i in range(len(indents)):
+            if not nonblank[i]:  # Skip empty lines
                 continue
 
             # Get indentation level
-            indent = len(line) - len(line.lstrip())
+            indent = indents[i]
 
             # Pop from stack if this line has less indentation
             while indent_stack and indent_stack[-1][0] >= indent:
@@ -195,55 +237,47 @@ class CodeFolder:
                     )
 
             # Push current indentation
-            if line.strip():
-                indent_stack.append((indent, i, 4 + (indent // 4)))
+            indent_stack.append((indent, i, 4 + (indent // 4)))
 
-    def _find_block_end(self, lines: List[str], start: int) -> int:
+    def _find_block_end(self, start: int) -> int:
         """Find the end line of a code block starting at given line.
 
         Args:
-            lines: List of code lines
             start: Starting line index
 
         Returns:
             Index of the last line of the block
         """
-        if start >= len(lines):
+        indents = self._indentation_levels
+        nonblank = self._nonblank_lines
+        line_count = len(indents)
+        if start >= line_count:
             return start
 
-        start_indent = len(lines[start]) - len(lines[start].lstrip())
+        start_indent = indents[start]
 
         # Find the next line with same or less indentation (but not empty)
-        for i in range(start + 1, len(lines)):
-            line = lines[i]
-            if not line.strip():  # Skip empty lines
-                continue
-
-            current_indent = len(line) - len(line.lstrip())
-            if current_indent <= start_indent:
+        for i in range(start + 1, line_count):
+            if nonblank[i] and indents[i] <= start_indent:
                 return i - 1
 
-        return len(lines) - 1
+        return line_count - 1
 
-    def _find_comment_end(self, lines: List[str], start: int) -> int:
+    def _find_comment_end(self, comment_lines: Set[int], start: int) -> int:
         """Find the end of a comment block.
 
         Args:
-            lines: List of code lines
+            comment_lines: Numbers of all lines that start with a comment
             start: Starting line index
 
         Returns:
             Index of the last line of the comment
         """
-        if start >= len(lines):
-            return start
-
         # Find next non-comment line
-        for i in range(start + 1, len(lines)):
-            if not self.COMMENT_PATTERN.search(lines[i]):
-                return i - 1
-
-        return len(lines) - 1
+        end = start
+        while end + 1 in comment_lines:
+            end += 1
+        return end
 
     def get_regions_at_line(self, line_num: int) -> List[FoldRegion]:
         """Get all regions that contain a specific line.
@@ -254,7 +288,15 @@ class CodeFolder:
         Returns:
             List of regions containing the line
         """
-        return [r for r in self.regions if r.contains_line(line_num)]
+        self._ensure_region_index()
+        regions = self.regions
+        order = self._index_order
+
+        # Only regions starting within the longest span before line_num can contain it
+        lo = bisect.bisect_left(self._index_starts, line_num - self._max_span)
+        hi = bisect.bisect_right(self._index_starts, line_num)
+        hits = sorted(order[j] for j in range(lo, hi) if regions[order[j]].end_line >= line_num)
+        return [regions[i] for i in hits]
 
     def get_top_level_regions(self) -> List[FoldRegion]:
         """Get only top-level regions (level 0).
@@ -273,11 +315,35 @@ class CodeFolder:
         Returns:
             List of nested regions
         """
-        return [
-            r
-            for r in self.regions
-            if r.start_line > parent.start_line and r.end_line < parent.end_line and r.level > parent.level
-        ]
+        self._ensure_region_index()
+        regions = self.regions
+        order = self._index_order
+
+        lo = bisect.bisect_right(self._index_starts, parent.start_line)
+        hi = bisect.bisect_left(self._index_starts, parent.end_line)
+        hits = sorted(
+            order[j]
+            for j in range(lo, hi)
+            if regions[order[j]].end_line < parent.end_line and regions[order[j]].level > parent.level
+        )
+        return [regions[i] for i in hits]
+
+    def _ensure_region_index(self) -> None:
+        """Rebuild the start-sorted region index if self.regions has changed.
+
+        The index is checked against a copy of the list it was built from, so
+        appended, removed, replaced or reordered regions are noticed. The list
+        comparison matches items by identity first, which keeps it cheap.
+        """
+        regions = self.regions
+        if FoldRegion._line_changes == self._indexed_line_changes and regions == self._indexed_regions:
+            return
+
+        self._index_order = sorted(range(len(regions)), key=lambda i: regions[i].start_line)
+        self._index_starts = [regions[i].start_line for i in self._index_order]
+        self._max_span = max((r.end_line - r.start_line for r in regions), default=0)
+        self._indexed_regions = list(regions)
+        self._indexed_line_changes = FoldRegion._line_changes
 
     def toggle_fold(self, region: FoldRegion) -> None:
         """Toggle fold state of a region.
@@ -333,16 +399,18 @@ class CodeFolder:
         Returns:
             List of visible line numbers (0-indexed)
         """
-        total_lines = len(text.split("\n"))
-        visible = set(range(total_lines))
+        total_lines = text.count("\n") + 1
+        visible = bytearray(b"\x01") * total_lines
 
-        # Remove lines that are inside folded regions
+        # Clear lines that are inside folded regions with one slice assignment each
         for region in self.regions:
             if region.is_folded:
-                for i in range(region.start_line + 1, region.end_line + 1):
-                    visible.discard(i)
+                start = min(region.start_line + 1, total_lines)
+                end = min(region.end_line + 1, total_lines)
+                if end > start:
+                    visible[start:end] = bytes(end - start)
 
-        return sorted(visible)
+        return list(itertools.compress(range(total_lines), visible))
 
     def get_fold_indicators(self) -> List[Tuple[int, bool]]:
         """Get fold indicators for each region start line.
@@ -360,3 +428,4 @@ class CodeFolder:
         """Clear all regions."""
         self.regions = []
         self._indentation_levels = []
+        self._nonblank_lines = []
@@ -1,7 +1,41 @@
 """Document model for managing text content and state."""
 
-from typing import Optional
+from typing import Callable, Optional
 from pathlib import Path
+from src.piece_table import PieceTable
+
+# Undo/redo entry (start, end, text, version): replacing content[start:end] with
+# text reverts one edit and returns the document to that content version
+Edit = tuple[int, int, str, int]
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Get the length of the longest common prefix of two strings.
+
+    Binary search over slice comparisons keeps the scanning in C; each step
+    only compares the span not yet known to match, so total work is linear.
+    """
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Get the length of the longest common suffix of two strings, at most limit."""
+    len_a, len_b = len(a), len(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len_a - mid : len_a - lo] == b[len_b - mid : len_b - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
 
 
 class Document:
@@ -13,24 +47,91 @@ class Document:
         Args:
             content: Initial text content
         """
-        self._content = content
-        self._original_content = content
+        self._pieces = PieceTable(content)
+        # Each distinct content state gets a version; undo/redo restore earlier ones
+        self._version = 0
+        self._last_version = 0
+        self._saved_version = 0
         self._file_path: Optional[Path] = None
-        self._undo_stack: list[str] = []
-        self._redo_stack: list[str] = []
+        self._undo_stack: list[Edit] = []
+        self._redo_stack: list[Edit] = []
+        # Called with the new is_modified value whenever it flips
+        self._modified_listeners: list[Callable[[bool], None]] = []
 
     @property
     def content(self) -> str:
         """Get the current content."""
-        return self._content
+        return self._pieces.text
 
     @content.setter
     def content(self, value: str) -> None:
-        """Set the content and track for undo."""
-        if self._content != value:
-            self._undo_stack.append(self._content)
-            self._redo_stack.clear()
-            self._content = value
+        """Set the content and track for undo.
+
+        Only the span that differs from the current content is recorded.
+        """
+        old = self._pieces.text
+        prefix = _common_prefix_length(old, value)
+        if prefix == len(old) == len(value):
+            return
+
+        suffix = _common_suffix_length(old, value, min(len(old), len(value)) - prefix)
+        self.apply_edit(prefix, len(old) - suffix, value[prefix : len(value) - suffix])
+
+    def apply_edit(self, start: int, end: int, replacement: str) -> None:
+        """Replace content[start:end] with replacement and track for undo.
+
+        Args:
+            start: Start offset of the replaced span
+            end: End offset (exclusive) of the replaced span
+            replacement: Text to insert in place of the span
+
+        Raises:
+            ValueError: If the span is outside the content
+        """
+        if not 0 <= start <= end <= len(self._pieces):
+            raise ValueError(f"Invalid edit span {start}:{end} for content of length {len(self._pieces)}")
+
+        self._last_version += 1
+        self._undo_stack.append(self._replace(start, end, replacement, self._last_version))
+        self._redo_stack.clear()
+
+    def _replace(self, start: int, end: int, replacement: str, version: int) -> Edit:
+        """Replace a span of content and move to a new content version.
+
+        Returns:
+            The edit that reverts this replacement
+        """
+        was_modified = self.is_modified
+        removed = self._pieces.slice(start, end)
+        self._pieces.delete(start, end)
+        self._pieces.insert(start, replacement)
+        revert = (start, start + len(replacement), removed, self._version)
+        self._version = version
+        self._notify_modified(was_modified)
+        return revert
+
+    def add_modified_listener(self, callback: Callable[[bool], None]) -> None:
+        """Register a callback for changes of the modified state.
+
+        Args:
+            callback: Called with the new is_modified value each time it changes
+        """
+        self._modified_listeners.append(callback)
+
+    def remove_modified_listener(self, callback: Callable[[bool], None]) -> None:
+        """Unregister a callback added with add_modified_listener.
+
+        Args:
+            callback: The callback to remove
+        """
+        self._modified_listeners.remove(callback)
+
+    def _notify_modified(self, was_modified: bool) -> None:
+        """Tell listeners about the modified state if it differs from was_modified."""
+        modified = self.is_modified
+        if modified != was_modified:
+            for callback in self._modified_listeners:
+                callback(modified)
 
     @property
     def file_path(self) -> Optional[Path]:
@@ -45,11 +146,13 @@ class Document:
     @property
     def is_modified(self) -> bool:
         """Check if document has unsaved changes."""
-        return self._content != self._original_content
+        return self._version != self._saved_version
 
     def mark_saved(self) -> None:
-        """Mark the document as saved (original content = current content)."""
-        self._original_content = self._content
+        """Mark the document as saved (saved version = current version)."""
+        was_modified = self.is_modified
+        self._saved_version = self._version
+        self._notify_modified(was_modified)
         self._undo_stack.clear()
         self._redo_stack.clear()
 
@@ -62,8 +165,7 @@ class Document:
         if not self._undo_stack:
             return False
 
-        self._redo_stack.append(self._content)
-        self._content = self._undo_stack.pop()
+        self._redo_stack.append(self._replace(*self._undo_stack.pop()))
         return True
 
     def redo(self) -> bool:
@@ -75,8 +177,7 @@ class Document:
         if not self._redo_stack:
             return False
 
-        self._undo_stack.append(self._content)
-        self._content = self._redo_stack.pop()
+        self._undo_stack.append(self._replace(*self._redo_stack.pop()))
         return True
 
     def can_undo(self) -> bool:
@@ -95,8 +196,10 @@ class Document:
 
     def clear(self) -> None:
         """Clear the document and reset state."""
-        self._content = ""
-        self._original_content = ""
+        was_modified = self.is_modified
+        self._pieces = PieceTable()
+        self._saved_version = self._version
         self._file_path = None
         self._undo_stack.clear()
         self._redo_stack.clear()
+        self._notify_modified(was_modified)
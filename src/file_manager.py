@@ -1,9 +1,14 @@
 """File manager for handling document file I/O operations."""
 
+import mmap
+import os
 from pathlib import Path
 from typing import Optional
 from src.document import Document
 
+# Files at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
 
 class FileManager:
     """Manages file operations for text documents."""
@@ -28,11 +33,21 @@ class FileManager:
             raise FileNotFoundError(f"File not found: {path}")
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Read raw bytes and decode once instead of going through TextIOWrapper
+            with open(path, "rb") as f:
+                size = path.stat().st_size
+                if size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = str(mm, "utf-8")
+                else:
+                    content = f.read().decode("utf-8")
         except IOError as e:
             raise IOError(f"Failed to read file {path}: {e}")
 
+        # Match text mode's universal newlines
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+
         doc = Document(content)
         doc.file_path = path
         doc.mark_saved()
@@ -64,8 +79,7 @@ class FileManager:
 
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(document.content)
+            FileManager.write_atomic(path, document.content.encode("utf-8"))
         except IOError as e:
             raise IOError(f"Failed to write file {path}: {e}")
 
@@ -73,6 +87,39 @@ class FileManager:
         document.mark_saved()
         return path
 
+    @staticmethod
+    def write_atomic(path: Path, data: bytes) -> None:
+        """Write bytes to a file via a temporary file and an atomic rename.
+
+        The existing file is only replaced once all data has been written, so a
+        failed save never leaves it truncated. Symlinks are followed and the
+        target's permission bits are kept.
+
+        Args:
+            path: Path to write to
+            data: Encoded file content
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        target = Path(os.path.realpath(path))
+        tmp_path = target.with_name(f".{target.name}.tmp")
+
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                if target.exists():
+                    os.fchmod(fd, target.stat().st_mode & 0o7777)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     @staticmethod
     def save_as(document: Document, file_path: str | Path) -> Path:
         """Save document with a new file path (Save As).
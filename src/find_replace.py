@@ -1,6 +1,61 @@
 """Find and replace functionality for text content."""
 
-from typing import List, Tuple, Optional
+import functools
+import re
+from typing import Iterator, List, Tuple, Optional
+
+# Characters that break a whole word when next to a match ([^\W_] is \w without
+# the underscore, matching str.isalnum)
+_ALNUM = r"[^\W_]"
+
+
+def _fold_case(text: str) -> str:
+    """Case-fold text for case-insensitive matching.
+
+    ASCII text takes str.lower, which has a fast path for it and gives the same
+    result as casefold there; other text uses casefold so that e.g. "ſ" and
+    "s" match.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        The case-folded text
+    """
+    return text.lower() if text.isascii() else text.casefold()
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_search(search_term: str, case_sensitive: bool, whole_words: bool) -> Tuple[re.Pattern, bool]:
+    """Compile the pattern for a literal search term.
+
+    The pattern starts with the literal term so the regex engine can skip
+    straight to candidate positions; whole-word checks come after it as a
+    lookbehind covering the term plus the preceding character, and a lookahead.
+
+    Args:
+        search_term: Literal text to find
+        case_sensitive: Whether to match case
+        whole_words: Whether matches must not touch alphanumeric characters
+
+    Returns:
+        Tuple of (compiled pattern, whether occurrences of the term can overlap)
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    term = re.escape(search_term)
+    pattern = term
+    if whole_words:
+        pattern += "(?<!" + _ALNUM + term + ")(?!" + _ALNUM + ")"
+
+    # Occurrences can only overlap if some proper prefix of the term equals its
+    # suffix. lower() agrees with re's case folding for ASCII terms; other
+    # case-insensitive terms are assumed to overlap, which is always safe
+    if case_sensitive or search_term.isascii():
+        folded = search_term if case_sensitive else search_term.lower()
+        can_overlap = any(folded[:k] == folded[-k:] for k in range(1, len(folded)))
+    else:
+        can_overlap = True
+    return re.compile(pattern, flags), can_overlap
 
 
 class FindReplaceEngine:
@@ -10,6 +65,9 @@ class FindReplaceEngine:
         """Initialize the find/replace engine."""
         self.case_sensitive = False
         self.whole_words = False
+        # Case-folded copy of the last text searched case-insensitively
+        self._lower_source: Optional[str] = None
+        self._lower_text = ""
 
     def find_all(self, text: str, search_term: str) -> List[Tuple[int, int]]:
         """Find all occurrences of search term in text.
@@ -24,26 +82,7 @@ class FindReplaceEngine:
         if not search_term:
             return []
 
-        matches = []
-        search_text = text if self.case_sensitive else text.lower()
-        search_term_lower = search_term if self.case_sensitive else search_term.lower()
-
-        start = 0
-        while True:
-            pos = search_text.find(search_term_lower, start)
-            if pos == -1:
-                break
-
-            # Check whole words constraint
-            if self.whole_words:
-                if not self._is_whole_word(text, pos, pos + len(search_term)):
-                    start = pos + 1
-                    continue
-
-            matches.append((pos, pos + len(search_term)))
-            start = pos + 1
-
-        return matches
+        return list(self._iter_matches(text, search_term))
 
     def find_next(
         self, text: str, search_term: str, start_pos: int
@@ -61,20 +100,9 @@ class FindReplaceEngine:
         if not search_term:
             return None
 
-        search_text = text if self.case_sensitive else text.lower()
-        search_term_lower = search_term if self.case_sensitive else search_term.lower()
-
-        pos = search_text.find(search_term_lower, start_pos)
-
-        while pos != -1:
-            if self.whole_words:
-                if self._is_whole_word(text, pos, pos + len(search_term)):
-                    return (pos, pos + len(search_term))
-                pos = search_text.find(search_term_lower, pos + 1)
-            else:
-                return (pos, pos + len(search_term))
-
-        return None
+        haystack, (pattern, _) = self._search_target(text, search_term)
+        match = pattern.search(haystack, start_pos)
+        return match.span() if match else None
 
     def find_previous(
         self, text: str, search_term: str, start_pos: int
@@ -92,20 +120,28 @@ class FindReplaceEngine:
         if not search_term:
             return None
 
-        search_text = text if self.case_sensitive else text.lower()
-        search_term_lower = search_term if self.case_sensitive else search_term.lower()
-
-        pos = search_text.rfind(search_term_lower, 0, start_pos)
-
-        while pos != -1:
-            if self.whole_words:
-                if self._is_whole_word(text, pos, pos + len(search_term)):
-                    return (pos, pos + len(search_term))
-                pos = search_text.rfind(search_term_lower, 0, pos)
-            else:
-                return (pos, pos + len(search_term))
+        haystack, (pattern, _) = self._search_target(text, search_term)
+        if haystack is not text or self.case_sensitive:
+            # The haystack holds the term literally, so scan backwards with rfind
+            # and only run the pattern to check word boundaries
+            term = search_term if self.case_sensitive else _fold_case(search_term)
+            end = max(start_pos, 0)
+            while True:
+                pos = haystack.rfind(term, 0, end)
+                if pos < 0:
+                    return None
+                if pattern.match(haystack, pos):
+                    return pos, pos + len(term)
+                end = pos + len(term) - 1
+
+        # Keep the last match that ends at or before start_pos
+        found = None
+        for span in self._iter_matches(text, search_term):
+            if span[1] > start_pos:
+                break
+            found = span
 
-        return None
+        return found
 
     def replace(self, text: str, search_term: str, replace_term: str) -> Tuple[str, int]:
         """Replace first occurrence of search term.
@@ -121,12 +157,12 @@ class FindReplaceEngine:
         if not search_term:
             return text, 0
 
-        matches = self.find_all(text, search_term)
+        match = self.find_next(text, search_term, 0)
 
-        if not matches:
+        if not match:
             return text, 0
 
-        start, end = matches[0]
+        start, end = match
         modified = text[:start] + replace_term + text[end:]
 
         return modified, 1
@@ -134,6 +170,9 @@ class FindReplaceEngine:
     def replace_all(self, text: str, search_term: str, replace_term: str) -> Tuple[str, int]:
         """Replace all occurrences of search term.
 
+        Overlapping occurrences are replaced left to right, skipping any that
+        overlap an earlier replacement.
+
         Args:
             text: Text to search in
             search_term: Term to find
@@ -145,42 +184,103 @@ class FindReplaceEngine:
         if not search_term:
             return text, 0
 
-        matches = self.find_all(text, search_term)
-
-        if not matches:
+        if self.case_sensitive and not self.whole_words:
+            count = text.count(search_term)
+            return (text.replace(search_term, replace_term), count) if count else (text, 0)
+
+        haystack, (pattern, _) = self._search_target(text, search_term)
+        if haystack is text:
+            # One C-level pass; doubling backslashes keeps the replacement literal
+            return pattern.subn(replace_term.replace("\\", "\\\\"), text)
+
+        # Matches were found in the case-folded copy; splice the original text
+        parts = []
+        prev_end = 0
+        for match in pattern.finditer(haystack):
+            start, end = match.span()
+            parts.append(text[prev_end:start])
+            parts.append(replace_term)
+            prev_end = end
+
+        if not parts:
             return text, 0
 
-        # Replace from end to start to preserve positions
-        modified = text
-        for start, end in reversed(matches):
-            modified = modified[:start] + replace_term + modified[end:]
+        parts.append(text[prev_end:])
+        return "".join(parts), len(parts) // 2
 
-        return modified, len(matches)
+    def set_document(self, text: str) -> None:
+        """Precompute the case-folded copy of the document text.
 
-    def _is_whole_word(self, text: str, start: int, end: int) -> bool:
-        """Check if match is a whole word (not part of larger word).
+        Searches of an equal text reuse the copy, so it is built once per
+        document change rather than once per search. Calling this is optional;
+        the first case-insensitive search of a new text does the same.
 
         Args:
-            text: Full text
-            start: Start position of match
-            end: End position of match
+            text: Current document text
+        """
+        self._lower_source = text
+        self._lower_text = _fold_case(text)
+
+    def invalidate_text_cache(self) -> None:
+        """Drop the cached case-folded text, e.g. after the document is edited."""
+        self._lower_source = None
+        self._lower_text = ""
+
+    def _search_target(self, text: str, search_term: str) -> Tuple[str, Tuple[re.Pattern, bool]]:
+        """Get the string to scan and the compiled pattern for the current settings.
+
+        Case-insensitive searches scan a cached case-folded copy of the text with
+        a case-sensitive pattern, which is much faster than re.IGNORECASE. This is
+        only done when folding keeps every offset the same.
+
+        Args:
+            text: Text to search in
+            search_term: Term to find
 
         Returns:
-            True if match is a whole word
+            Tuple of (haystack, (compiled pattern, whether occurrences can overlap))
+        """
+        if not self.case_sensitive:
+            term = _fold_case(search_term)
+            if len(term) == len(search_term):
+                if text is not self._lower_source and text != self._lower_source:
+                    self.set_document(text)
+                if len(self._lower_text) == len(text):
+                    return self._lower_text, _compile_search(term, True, self.whole_words)
+
+        return text, _compile_search(search_term, self.case_sensitive, self.whole_words)
+
+    def _iter_matches(self, text: str, search_term: str) -> Iterator[Tuple[int, int]]:
+        """Yield every match span in order, including overlapping ones.
+
+        Args:
+            text: Text to search in
+            search_term: Term to find
+
+        Yields:
+            (start_pos, end_pos) for each match
         """
-        # Check character before match
-        if start > 0 and text[start - 1].isalnum():
-            return False
+        haystack, (pattern, can_overlap) = self._search_target(text, search_term)
 
-        # Check character after match
-        if end < len(text) and text[end].isalnum():
-            return False
+        if not can_overlap:
+            # Non-overlapping scan finds every occurrence in one C-level pass
+            for match in pattern.finditer(haystack):
+                yield match.span()
+            return
 
-        return True
+        match = pattern.search(haystack)
+        while match:
+            yield match.span()
+            match = pattern.search(haystack, match.start() + 1)
 
     def set_case_sensitive(self, case_sensitive: bool) -> None:
         """Set case sensitivity for searches.
 
+        Case-insensitive searches compare case-folded text (str.casefold), so
+        they also match characters such as "ſ" and "s" that only fold
+        together. Terms or texts whose folded form changes length (e.g. "ß"
+        folds to "ss") fall back to re.IGNORECASE.
+
         Args:
             case_sensitive: Whether to match case
         """
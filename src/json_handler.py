@@ -1,7 +1,102 @@
 """JSON handling functionality for jText."""
 
 import json
-from typing import Tuple, Optional
+import re
+from typing import Any, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is the fallback
+    orjson = None
+
+# JSON whitespace followed by a character that can start a JSON value
+# (NaN and Infinity are accepted by the stdlib parser)
+_JSON_START = re.compile(r'[ \t\n\r]*[{\["\-0-9tfnNI]')
+
+# A possible float, which orjson writes differently from json (1.5e-7 against
+# 1.5e-07), or an integer of 19+ digits, which orjson may parse as a float
+_ORJSON_DIFFERS = re.compile(r"[0-9](?:[.eE]|[0-9]{18})")
+
+# The last text checked by _is_valid_json and its result. Only one buffer is
+# kept alive, and it is replaced by the next check.
+_last_checked: Tuple[Optional[str], bool] = (None, False)
+
+
+def _loads(content: str) -> Any:
+    """Parse JSON, trying orjson first when it is installed.
+
+    orjson is stricter than the stdlib parser (no NaN/Infinity, 64-bit
+    integers, limited depth), so anything it rejects is handed to json.loads,
+    which either accepts it or raises the usual JSONDecodeError.
+
+    Args:
+        content: JSON content to parse
+
+    Returns:
+        The parsed value
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def _is_valid_json(content: str) -> bool:
+    """Check if content parses as JSON, remembering the last answer.
+
+    Args:
+        content: Text content to check
+
+    Returns:
+        True if content is valid JSON, False otherwise
+    """
+    global _last_checked
+    last, result = _last_checked
+    if content is last:
+        return result
+
+    try:
+        _loads(content)
+        result = True
+    except ValueError:
+        result = False
+    _last_checked = (content, result)
+    return result
+
+
+def _reformat(content: str, indent: Optional[int]) -> str:
+    """Parse JSON and serialize it again.
+
+    The output is always what the json module would write: orjson is only
+    used when the text holds no floats or very large integers, where the two
+    could disagree.
+
+    Args:
+        content: JSON content to reformat
+        indent: Number of spaces for indentation, None to minify
+
+    Returns:
+        The reformatted JSON
+
+    Raises:
+        ValueError: If content is not valid JSON
+    """
+    # orjson only supports two-space indentation
+    if orjson is not None and indent in (None, 2) and not _ORJSON_DIFFERS.search(content):
+        try:
+            parsed = orjson.loads(content)
+            if indent is None:
+                return orjson.dumps(parsed).decode()
+            return orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()
+        except (orjson.JSONDecodeError, orjson.JSONEncodeError):
+            pass
+
+    parsed = json.loads(content)
+    if indent is None:
+        return json.dumps(parsed, separators=(',', ':'), ensure_ascii=False)
+    return json.dumps(parsed, indent=indent, sort_keys=False, ensure_ascii=False)
 
 
 class JsonHandler:
@@ -17,14 +112,11 @@ class JsonHandler:
         Returns:
             True if content is valid JSON, False otherwise
         """
-        if not content or not content.strip():
+        # Rejects prose and code after the leading whitespace, without a parse
+        if not content or not _JSON_START.match(content):
             return False
 
-        try:
-            json.loads(content)
-            return True
-        except (json.JSONDecodeError, ValueError):
-            return False
+        return _is_valid_json(content)
 
     @staticmethod
     def format_json(content: str, indent: int = 2) -> Tuple[str, bool]:
@@ -42,9 +134,7 @@ class JsonHandler:
             return "", False
 
         try:
-            parsed = json.loads(content)
-            formatted = json.dumps(parsed, indent=indent, sort_keys=False, ensure_ascii=False)
-            return formatted, True
+            return _reformat(content, indent), True
         except (json.JSONDecodeError, ValueError) as e:
             return content, False
 
@@ -63,9 +153,7 @@ class JsonHandler:
             return "", False
 
         try:
-            parsed = json.loads(content)
-            minified = json.dumps(parsed, separators=(',', ':'), ensure_ascii=False)
-            return minified, True
+            return _reformat(content, None), True
         except (json.JSONDecodeError, ValueError):
             return content, False
 
@@ -83,7 +171,7 @@ class JsonHandler:
             return "Empty content"
 
         try:
-            json.loads(content)
+            _loads(content)
             return None
         except json.JSONDecodeError as e:
             return f"JSON Error at line {e.lineno}, column {e.colno}: {e.msg}"
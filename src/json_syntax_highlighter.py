@@ -3,6 +3,20 @@
 from PyQt6.QtGui import QSyntaxHighlighter, QTextDocument, QTextCharFormat, QColor, QFont
 from PyQt6.QtCore import QRegularExpression
 
+# One alternation covering every token, tried left to right at each position.
+# Strings are consumed whole, so numbers, keywords and brackets inside them are
+# never seen. An unterminated string (group 3) and a backslash escape outside a
+# string are consumed without formatting.
+_TOKEN_PATTERN = (
+    r'("(?:[^"\\]|\\.)*")(?=\s*:)'  # 1: key
+    r'|("(?:[^"\\]|\\.)*")'  # 2: string
+    r'|("(?:[^"\\]|\\.)*)'  # 3: unterminated string
+    r'|(-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?)'  # 4: number
+    r'|(\b(?:true|false|null)\b)'  # 5: keyword
+    r'|([{}\[\],:;])'  # 6: bracket
+    r'|\\.'
+)
+
 
 class JsonSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for JSON documents."""
@@ -38,79 +52,32 @@ class JsonSyntaxHighlighter(QSyntaxHighlighter):
         self.error_format.setForeground(QColor("#ff0000"))  # Red background
         self.error_format.setBackground(QColor("#ffcccc"))
 
+        # Compile the token pattern once; highlightBlock runs for every changed line
+        self._token_re = QRegularExpression(_TOKEN_PATTERN)
+        self._token_re.optimize()
+
+        # Format for each capture group of the token pattern (None: leave as is)
+        self._group_formats = [
+            None,
+            self.key_format,
+            self.string_format,
+            None,
+            self.number_format,
+            self.true_false_null_format,
+            self.bracket_format,
+        ]
+
     def highlightBlock(self, text: str) -> None:
         """Highlight a block of text (a line).
 
         Args:
             text: The text block to highlight
         """
-        # Highlight JSON keys (strings before colons)
-        key_pattern = QRegularExpression(r'"([^"\\]|\\.)*"\s*(?=:)')
-        iterator = key_pattern.globalMatch(text)
-        while iterator.hasNext():
-            match = iterator.next()
-            self.setFormat(match.capturedStart(), match.capturedLength(), self.key_format)
-
-        # Highlight string values (strings not followed by colon)
-        string_pattern = QRegularExpression(r'"(?:[^"\\]|\\.)*"')
-        iterator = string_pattern.globalMatch(text)
-        while iterator.hasNext():
-            match = iterator.next()
-            # Skip if this is a key (already highlighted)
-            if text[match.capturedEnd():match.capturedEnd() + 1].lstrip() != ':':
-                self.setFormat(match.capturedStart(), match.capturedLength(), self.string_format)
-
-        # Highlight numbers
-        number_pattern = QRegularExpression(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?')
-        iterator = number_pattern.globalMatch(text)
-        while iterator.hasNext():
-            match = iterator.next()
-            # Check if number is not inside a string
-            if not self._is_in_string(text, match.capturedStart()):
-                self.setFormat(match.capturedStart(), match.capturedLength(), self.number_format)
-
-        # Highlight true, false, null
-        for word in ['true', 'false', 'null']:
-            pattern = QRegularExpression(r'\b' + word + r'\b')
-            iterator = pattern.globalMatch(text)
-            while iterator.hasNext():
-                match = iterator.next()
-                if not self._is_in_string(text, match.capturedStart()):
-                    self.setFormat(match.capturedStart(), match.capturedLength(), self.true_false_null_format)
-
-        # Highlight brackets and braces
-        bracket_pattern = QRegularExpression(r'[{}\[\],:;]')
-        iterator = bracket_pattern.globalMatch(text)
+        group_formats = self._group_formats
+        iterator = self._token_re.globalMatch(text)
         while iterator.hasNext():
             match = iterator.next()
-            if not self._is_in_string(text, match.capturedStart()):
-                self.setFormat(match.capturedStart(), match.capturedLength(), self.bracket_format)
-
-    def _is_in_string(self, text: str, position: int) -> bool:
-        """Check if a position is inside a string.
-
-        Args:
-            text: The text to check
-            position: The position to check
-
-        Returns:
-            True if position is inside a string, False otherwise
-        """
-        in_string = False
-        escape = False
-
-        for i in range(min(position, len(text))):
-            char = text[i]
-
-            if escape:
-                escape = False
-                continue
-
-            if char == '\\':
-                escape = True
-                continue
-
-            if char == '"':
-                in_string = not in_string
-
-        return in_string
+            # Only the group of the matching alternative is captured
+            text_format = group_formats[match.lastCapturedIndex()]
+            if text_format is not None:
+                self.setFormat(match.capturedStart(), match.capturedLength(), text_format)
@@ -1,12 +1,55 @@
 """JSON tree model for representing hierarchical JSON structure."""
 
+import functools
 import json
+import sys
+from dataclasses import dataclass
 from typing import Any, List, Optional, Dict
 
 
+@dataclass(slots=True, frozen=True)
+class _ContainerSummary:
+    """Stand-in for an object or array value once its children are built.
+
+    Keeps only what the node displays, so the parsed dict or list can be freed.
+    """
+
+    kind: type  # dict or list
+    count: int
+
+    def __len__(self) -> int:
+        """Get the number of keys or items."""
+        return self.count
+
+
+@functools.lru_cache(maxsize=4096)
+def _container_label(prefix: str, type_name: str, count: int, unit: str) -> str:
+    """Build the display text for an object or array node.
+
+    Large documents repeat the same labels (same key, type and size) many
+    times, so labels are cached and interned to share one string.
+
+    Args:
+        prefix: Key or array index prefix, including the separator
+        type_name: "Object" or "Array"
+        count: Number of keys or items
+        unit: "keys" or "items"
+
+    Returns:
+        The display text
+    """
+    return sys.intern(f"{prefix}{type_name} ({count} {unit})")
+
+
 class JsonTreeNode:
     """Represents a single node in the JSON tree."""
 
+    # Trees can hold millions of nodes; slots drop the per-node __dict__
+    __slots__ = (
+        "key", "value", "parent", "is_array_item", "array_index",
+        "_children", "_deferred", "_expanded", "_display_text",
+    )
+
     def __init__(
         self,
         key: Optional[str] = None,
@@ -29,8 +72,43 @@ class JsonTreeNode:
         self.parent = parent
         self.is_array_item = is_array_item
         self.array_index = array_index
-        self.children: List["JsonTreeNode"] = []
+        self._children: List["JsonTreeNode"] = []
+        self._deferred = False  # Children of a scalar array not created yet
         self._expanded = True
+        self._display_text: Optional[str] = None
+
+    @property
+    def children(self) -> List["JsonTreeNode"]:
+        """Get the child nodes, creating deferred array items on first access."""
+        if self._deferred:
+            self._deferred = False
+            self._children = self._array_children()
+            for child in self._children:
+                child._expanded = self._expanded
+            self.value = _ContainerSummary(list, len(self.value))
+        return self._children
+
+    @children.setter
+    def children(self, children: List["JsonTreeNode"]) -> None:
+        """Replace the child nodes."""
+        self._children = children
+        self._deferred = False
+
+    def defer_children(self) -> None:
+        """Create the items of this array node only when children is first read.
+
+        Used for arrays of scalars, whose item nodes have no children of their
+        own and are often never looked at.
+        """
+        self._children = []
+        self._deferred = len(self.value) > 0
+
+    def _array_children(self) -> List["JsonTreeNode"]:
+        """Build one child node per item of this node's list value."""
+        return [
+            JsonTreeNode(value=item_value, parent=self, is_array_item=True, array_index=idx)
+            for idx, item_value in enumerate(self.value)
+        ]
 
     def add_child(self, child: "JsonTreeNode") -> None:
         """Add a child node.
@@ -41,24 +119,36 @@ class JsonTreeNode:
         child.parent = self
         self.children.append(child)
 
+    def value_type(self) -> type:
+        """Get the type of the value, dict or list for summarized containers."""
+        value = self.value
+        return value.kind if isinstance(value, _ContainerSummary) else type(value)
+
     def is_expandable(self) -> bool:
         """Check if node is expandable (has children)."""
-        return len(self.children) > 0
+        return self._deferred or len(self._children) > 0
 
     def get_display_text(self) -> str:
-        """Get the display text for this node."""
+        """Get the display text for this node, computed on first use."""
+        if self._display_text is None:
+            self._display_text = self._build_display_text()
+        return self._display_text
+
+    def _build_display_text(self) -> str:
+        """Build the display text for this node."""
+        value_type = self.value_type()
         if self.is_array_item:
-            if isinstance(self.value, (dict, list)):
-                type_name = "Object" if isinstance(self.value, dict) else "Array"
-                return f"[{self.array_index}] {type_name} ({len(self.value)} items)"
+            if value_type is dict or value_type is list:
+                type_name = "Object" if value_type is dict else "Array"
+                return _container_label(f"[{self.array_index}] ", type_name, len(self.value), "items")
             else:
                 return f"[{self.array_index}] {self._format_value(self.value)}"
         else:
             # Object key
-            if isinstance(self.value, dict):
-                return f'"{self.key}": Object ({len(self.value)} keys)'
-            elif isinstance(self.value, list):
-                return f'"{self.key}": Array ({len(self.value)} items)'
+            if value_type is dict:
+                return _container_label(f'"{self.key}": ', "Object", len(self.value), "keys")
+            elif value_type is list:
+                return _container_label(f'"{self.key}": ', "Array", len(self.value), "items")
             else:
                 return f'"{self.key}": {self._format_value(self.value)}'
 
@@ -95,16 +185,28 @@ class JsonTreeNode:
         return self._expanded
 
     def collapse_all(self) -> None:
-        """Recursively collapse all children."""
-        self._expanded = False
-        for child in self.children:
-            child.collapse_all()
+        """Collapse this node and all descendants."""
+        self._set_subtree_expanded(False)
 
     def expand_all(self) -> None:
-        """Recursively expand all children."""
-        self._expanded = True
-        for child in self.children:
-            child.expand_all()
+        """Expand this node and all descendants."""
+        self._set_subtree_expanded(True)
+
+    def _set_subtree_expanded(self, expanded: bool) -> None:
+        """Set expanded state on this node and all descendants.
+
+        Walks the subtree with an explicit stack so deep documents cannot
+        hit the recursion limit. Deferred array items are not created; they
+        take their array's state when they are.
+
+        Args:
+            expanded: True to expand, False to collapse
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._expanded = expanded
+            stack.extend(node._children)
 
 
 class JsonTreeModel:
@@ -117,9 +219,11 @@ class JsonTreeModel:
             json_str: JSON string to parse
         """
         self.root: Optional[JsonTreeNode] = None
-        self.raw_json = json_str
+        # Only kept while parsing; the tree holds everything needed afterwards
+        self.raw_json: Optional[str] = json_str
         if json_str and json_str.strip():
             self._parse_json(json_str)
+        self.raw_json = None
 
     def _parse_json(self, json_str: str) -> None:
         """Parse JSON string and build tree.
@@ -129,55 +233,49 @@ class JsonTreeModel:
         """
         try:
             data = json.loads(json_str)
-            self.root = self._build_tree(data, None)
+            self.root = self._build_tree(data)
         except json.JSONDecodeError:
             self.root = None
 
-    def _build_tree(
-        self,
-        data: Any,
-        parent: Optional[JsonTreeNode],
-        key: Optional[str] = None,
-        is_array_item: bool = False,
-        array_index: Optional[int] = None,
-    ) -> JsonTreeNode:
-        """Recursively build tree from JSON data.
+    @staticmethod
+    def _build_tree(data: Any) -> JsonTreeNode:
+        """Build tree from JSON data.
+
+        Uses an explicit stack instead of recursion, so nesting depth is not
+        bounded by the interpreter's recursion limit. Items of arrays that hold
+        no objects or arrays are created on first access (see
+        JsonTreeNode.defer_children). Once a container's children exist its
+        value is replaced by a _ContainerSummary, so the parsed data is not
+        kept alongside the tree.
 
         Args:
             data: JSON data (dict, list, or primitive)
-            parent: Parent node
-            key: Key for this node
-            is_array_item: Whether this is an array item
-            array_index: Index if array item
 
         Returns:
-            Root node of subtree
+            Root node of the tree
         """
-        node = JsonTreeNode(
-            key=key,
-            value=data,
-            parent=parent,
-            is_array_item=is_array_item,
-            array_index=array_index,
-        )
-
-        if isinstance(data, dict):
-            for item_key, item_value in data.items():
-                child = self._build_tree(
-                    item_value, node, key=item_key, is_array_item=False
-                )
-                node.add_child(child)
-        elif isinstance(data, list):
-            for idx, item_value in enumerate(data):
-                child = self._build_tree(
-                    item_value,
-                    node,
-                    is_array_item=True,
-                    array_index=idx,
-                )
-                node.add_child(child)
-
-        return node
+        root = JsonTreeNode(value=data)
+        stack = [root]
+
+        while stack:
+            node = stack.pop()
+            value = node.value
+            if isinstance(value, dict):
+                node.children = [
+                    JsonTreeNode(key=item_key, value=item_value, parent=node)
+                    for item_key, item_value in value.items()
+                ]
+            elif isinstance(value, list):
+                if not any(isinstance(item_value, (dict, list)) for item_value in value):
+                    node.defer_children()
+                    continue
+                node.children = node._array_children()
+            else:
+                continue
+            node.value = _ContainerSummary(type(value), len(value))
+            stack.extend(node.children)
+
+        return root
 
     def get_root(self) -> Optional[JsonTreeNode]:
         """Get root node."""
@@ -203,10 +301,29 @@ class JsonTreeModel:
     def _node_to_dict(node: JsonTreeNode) -> Any:
         """Convert tree node back to dictionary/list.
 
+        Summarized containers are rebuilt from their children.
+
         Args:
             node: Node to convert
 
         Returns:
             Dictionary, list, or primitive value
         """
-        return node.value
+        if not isinstance(node.value, _ContainerSummary):
+            return node.value
+
+        result: Any = {} if node.value.kind is dict else []
+        stack = [(node, result)]
+        while stack:
+            parent, container = stack.pop()
+            for child in parent.children:
+                value = child.value
+                if isinstance(value, _ContainerSummary):
+                    value = {} if value.kind is dict else []
+                    stack.append((child, value))
+                if isinstance(container, dict):
+                    container[child.key] = value
+                else:
+                    container.append(value)
+
+        return result
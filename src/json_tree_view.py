@@ -1,5 +1,7 @@
 """JSON tree view widget for displaying hierarchical JSON structure."""
 
+from typing import Dict, Optional, Tuple
+
 from PyQt6.QtWidgets import (
     QTreeWidget,
     QTreeWidgetItem,
@@ -9,7 +11,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtGui import QBrush, QFont, QColor
 
 from src.json_tree_model import JsonTreeModel, JsonTreeNode
 
@@ -17,6 +19,22 @@ from src.json_tree_model import JsonTreeModel, JsonTreeNode
 class JsonTreeView(QWidget):
     """Widget for displaying and interacting with JSON tree structure."""
 
+    PLACEHOLDER_TEXT = "Loading..."
+
+    # Item styles as (color, bold, italic), looked up by exact value type so
+    # bool is not mistaken for int
+    CONTAINER_STYLES = {
+        dict: ("#0066cc", True, False),  # Objects in blue
+        list: ("#cc0000", True, False),  # Arrays in bold red
+    }
+    ARRAY_ITEM_STYLE = ("#009900", False, False)  # Array items in green
+    VALUE_STYLES = {
+        type(None): ("#666666", False, True),  # null in gray
+        bool: ("#cc0000", False, False),  # Booleans in red
+        int: ("#cc6600", False, False),  # Numbers in orange
+        float: ("#cc6600", False, False),
+    }
+
     def __init__(self):
         """Initialize the JSON tree view."""
         super().__init__()
@@ -25,6 +43,9 @@ class JsonTreeView(QWidget):
         self.tree_widget.setColumnCount(1)
         self.tree_widget.setHeaderLabel("JSON Tree")
 
+        # Brushes and fonts are shared by every item with the same style
+        self._style_cache: Dict[Optional[Tuple[str, bool, bool]], Tuple[Optional[QBrush], QFont]] = {}
+
         # Setup UI
         self._setup_ui()
 
@@ -69,42 +90,32 @@ class JsonTreeView(QWidget):
         return True
 
     def _populate_tree(self) -> None:
-        """Populate tree widget from model."""
+        """Populate tree widget from model.
+
+        Only the top level is built here; deeper items are created when their
+        parent is first expanded (see _populate_children).
+        """
         root = self.model.get_root()
         if root is None:
             return
 
-        # Create root item
-        if root.is_array_item or root.key:
-            root_item = QTreeWidgetItem()
-            root_item.setText(0, root.get_display_text())
-            self._apply_formatting(root_item, root)
-            root_item.setData(0, Qt.ItemDataRole.UserRole, root)
-            self.tree_widget.addTopLevelItem(root_item)
-
-            # Add children to root
-            for child in root.children:
-                self._add_tree_item(root_item, child)
-        else:
-            # Root is the JSON root (object or array)
-            for child in root.children:
-                child_item = QTreeWidgetItem()
-                child_item.setText(0, child.get_display_text())
-                self._apply_formatting(child_item, child)
-                child_item.setData(0, Qt.ItemDataRole.UserRole, child)
-                self.tree_widget.addTopLevelItem(child_item)
-
-                # Add children
-                for grandchild in child.children:
-                    self._add_tree_item(child_item, grandchild)
-
-    def _add_tree_item(
-        self, parent_item: QTreeWidgetItem, node: JsonTreeNode
-    ) -> QTreeWidgetItem:
-        """Add tree item for a node.
+        self.tree_widget.setUpdatesEnabled(False)
+        try:
+            if root.is_array_item or root.key:
+                self.tree_widget.addTopLevelItem(self._create_item(root))
+            else:
+                # Root is the JSON root (object or array); add its children in one call
+                self.tree_widget.addTopLevelItems([self._create_item(child) for child in root.children])
+        finally:
+            self.tree_widget.setUpdatesEnabled(True)
+
+    def _create_item(self, node: JsonTreeNode) -> QTreeWidgetItem:
+        """Create a tree item for a node.
+
+        Expandable nodes get a single placeholder child so Qt shows an
+        expand arrow without building the subtree.
 
         Args:
-            parent_item: Parent tree widget item
             node: JSON tree node
 
         Returns:
@@ -115,53 +126,76 @@ class JsonTreeView(QWidget):
         self._apply_formatting(item, node)
         item.setData(0, Qt.ItemDataRole.UserRole, node)
 
-        parent_item.addChild(item)
-
-        # Add children recursively
-        for child in node.children:
-            self._add_tree_item(item, child)
+        if node.is_expandable():
+            item.addChild(QTreeWidgetItem([self.PLACEHOLDER_TEXT]))
 
         return item
 
-    @staticmethod
-    def _apply_formatting(item: QTreeWidgetItem, node: JsonTreeNode) -> None:
+    def _populate_children(self, item: QTreeWidgetItem) -> bool:
+        """Replace an item's placeholder with items for its real children.
+
+        Args:
+            item: Tree widget item to populate
+
+        Returns:
+            True if children were created, False if already populated
+        """
+        if item.childCount() != 1 or item.child(0).data(0, Qt.ItemDataRole.UserRole) is not None:
+            return False
+
+        node = item.data(0, Qt.ItemDataRole.UserRole)
+        item.takeChild(0)
+        item.addChildren([self._create_item(child) for child in node.children])
+        return True
+
+    def _apply_formatting(self, item: QTreeWidgetItem, node: JsonTreeNode) -> None:
         """Apply formatting to a tree item.
 
         Args:
             item: Tree widget item
             node: JSON tree node
         """
-        font = item.font(0)
-
-        if isinstance(node.value, dict):
-            # Object keys in blue
-            item.setForeground(0, QColor("#0066cc"))
-            font.setBold(True)
-        elif isinstance(node.value, list):
-            # Arrays in bold
-            item.setForeground(0, QColor("#cc0000"))
-            font.setBold(True)
-        elif node.is_array_item:
-            # Array items in green
-            item.setForeground(0, QColor("#009900"))
-        elif node.value is None:
-            # null in gray
-            item.setForeground(0, QColor("#666666"))
-            font.setItalic(True)
-        elif isinstance(node.value, bool):
-            # Booleans in red
-            item.setForeground(0, QColor("#cc0000"))
-        elif isinstance(node.value, (int, float)):
-            # Numbers in orange
-            item.setForeground(0, QColor("#cc6600"))
-
+        value_type = node.value_type()
+        style = self.CONTAINER_STYLES.get(value_type)
+        if style is None:
+            style = self.ARRAY_ITEM_STYLE if node.is_array_item else self.VALUE_STYLES.get(value_type)
+
+        brush, font = self._get_style(style)
+        if brush is not None:
+            item.setForeground(0, brush)
         item.setFont(0, font)
 
+    def _get_style(self, style: Optional[Tuple[str, bool, bool]]) -> Tuple[Optional[QBrush], QFont]:
+        """Get the shared brush and font for a style.
+
+        Args:
+            style: (color, bold, italic) tuple, or None for plain text
+
+        Returns:
+            Tuple of (brush or None, font)
+        """
+        cached = self._style_cache.get(style)
+        if cached is None:
+            font = QFont()
+            brush = None
+            if style is not None:
+                color, bold, italic = style
+                brush = QBrush(QColor(color))
+                font.setBold(bold)
+                font.setItalic(italic)
+            cached = self._style_cache[style] = (brush, font)
+        return cached
+
     def _on_item_expanded(self, item: QTreeWidgetItem) -> None:
         """Handle item expanded event."""
         node = item.data(0, Qt.ItemDataRole.UserRole)
         if node:
             node.set_expanded(True)
+            self.tree_widget.setUpdatesEnabled(False)
+            try:
+                self._populate_children(item)
+            finally:
+                self.tree_widget.setUpdatesEnabled(True)
 
     def _on_item_collapsed(self, item: QTreeWidgetItem) -> None:
         """Handle item collapsed event."""
@@ -172,7 +206,18 @@ class JsonTreeView(QWidget):
     def expand_all(self) -> None:
         """Expand all nodes in the tree."""
         self.model.expand_all()
-        self.tree_widget.expandAll()
+
+        # expandAll() does not emit itemExpanded, so build every level first
+        self.tree_widget.setUpdatesEnabled(False)
+        try:
+            stack = [self.tree_widget.topLevelItem(i) for i in range(self.tree_widget.topLevelItemCount())]
+            while stack:
+                item = stack.pop()
+                self._populate_children(item)
+                stack.extend(item.child(i) for i in range(item.childCount()))
+            self.tree_widget.expandAll()
+        finally:
+            self.tree_widget.setUpdatesEnabled(True)
 
     def collapse_all(self) -> None:
         """Collapse all nodes in the tree."""
@@ -0,0 +1,112 @@
+"""Newline index for mapping between text offsets and lines."""
+
+import bisect
+from typing import Iterable, List, Tuple
+
+
+class LineIndex:
+    """Positions of every newline in a text, found in a single pass.
+
+    Lines are numbered from 0 and split on "\\n" only, the same way as
+    text.split("\\n"), so a text always has at least one (possibly empty) line.
+    """
+
+    def __init__(self, text: str):
+        """Index a text.
+
+        Args:
+            text: The text to index
+        """
+        self.text = text
+        self.newlines: List[int] = []
+
+        pos = text.find("\n")
+        while pos != -1:
+            self.newlines.append(pos)
+            pos = text.find("\n", pos + 1)
+
+    def __len__(self) -> int:
+        """Get the number of lines."""
+        return len(self.newlines) + 1
+
+    def line_start(self, line_num: int) -> int:
+        """Get the offset of the first character of a line.
+
+        Args:
+            line_num: Line number (0-indexed)
+
+        Returns:
+            Offset of the line start
+        """
+        return self.newlines[line_num - 1] + 1 if line_num else 0
+
+    def line_end(self, line_num: int) -> int:
+        """Get the offset just past the last character of a line.
+
+        Args:
+            line_num: Line number (0-indexed)
+
+        Returns:
+            Offset of the line's newline, or the text length for the last line
+        """
+        return self.newlines[line_num] if line_num < len(self.newlines) else len(self.text)
+
+    def line(self, line_num: int) -> str:
+        """Get the text of a line without its newline.
+
+        Args:
+            line_num: Line number (0-indexed)
+
+        Returns:
+            The line text
+        """
+        return self.text[self.line_start(line_num) : self.line_end(line_num)]
+
+    def line_at_offset(self, offset: int) -> int:
+        """Get the line containing an offset.
+
+        Args:
+            offset: Offset into the text
+
+        Returns:
+            Line number (0-indexed); a newline belongs to the line it ends
+        """
+        return bisect.bisect_left(self.newlines, offset)
+
+    def line_and_column(self, offset: int) -> Tuple[int, int]:
+        """Convert a text offset to a (line, column) pair.
+
+        Args:
+            offset: Offset into the text
+
+        Returns:
+            Tuple of (line_num, column), both 0-indexed
+        """
+        line_num = self.line_at_offset(offset)
+        return line_num, offset - self.line_start(line_num)
+
+    def lines_and_columns(self, offsets: Iterable[int]) -> List[Tuple[int, int]]:
+        """Convert many text offsets to (line, column) pairs in one call.
+
+        Ascending offsets, such as the matches of a forward scan, only
+        search the newlines after the previous offset's line.
+
+        Args:
+            offsets: Offsets into the text
+
+        Returns:
+            List of (line_num, column) tuples, both 0-indexed, one per offset
+        """
+        newlines = self.newlines
+        bisect_left = bisect.bisect_left
+        result = []
+        line_num = 0
+        prev = 0
+
+        for offset in offsets:
+            line_num = bisect_left(newlines, offset, line_num if offset >= prev else 0)
+            line_start = newlines[line_num - 1] + 1 if line_num else 0
+            result.append((line_num, offset - line_start))
+            prev = offset
+
+        return result
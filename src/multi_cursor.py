@@ -1,10 +1,18 @@
 """Multi-cursor support for editing multiple locations simultaneously."""
 
-from typing import List, Optional
+import re
+from functools import total_ordering
+from operator import attrgetter
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+# Sort key comparing (line, column) tuples in C rather than calling __lt__
+_POSITION_KEY = attrgetter("line", "column")
+
+
+@total_ordering
+@dataclass(slots=True)
 class CursorPosition:
     """Represents a cursor position with line and column."""
 
@@ -15,17 +23,17 @@ class CursorPosition:
         """Check if two cursor positions are equal."""
         if not isinstance(other, CursorPosition):
             return False
-        return self.line == other.line and self.column == other.column
+        return _POSITION_KEY(self) == _POSITION_KEY(other)
 
     def __lt__(self, other):
         """Compare cursor positions for sorting."""
-        if self.line != other.line:
-            return self.line < other.line
-        return self.column < other.column
+        if not isinstance(other, CursorPosition):
+            return NotImplemented
+        return _POSITION_KEY(self) < _POSITION_KEY(other)
 
     def __hash__(self):
         """Make cursor position hashable."""
-        return hash((self.line, self.column))
+        return hash(_POSITION_KEY(self))
 
 
 class MultiCursorManager:
@@ -42,8 +50,10 @@ class MultiCursorManager:
         Args:
             position: The cursor position to add
         """
-        # Don't add duplicate cursors
-        if position not in self.cursors:
+        # Don't add duplicate cursors. Positions are mutable and callers keep
+        # references to them, so scan the current (line, column) keys rather
+        # than caching them; comparing tuples avoids a Python __eq__ per cursor
+        if _POSITION_KEY(position) not in map(_POSITION_KEY, self.cursors):
             self.cursors.append(position)
             self._normalize_cursors()
 
@@ -80,20 +90,49 @@ class MultiCursorManager:
         if not search_term:
             return
 
-        search_text = text if case_sensitive else text.lower()
-        search_term_normalized = search_term if case_sensitive else search_term.lower()
-
-        # Find all occurrences
-        lines = search_text.split("\n")
-        for line_num, line in enumerate(lines):
-            start_pos = 0
-            while True:
-                pos = line.find(search_term_normalized, start_pos)
-                if pos == -1:
-                    break
-                # Add cursor at end of match
-                self.cursors.append(CursorPosition(line_num, pos + len(search_term)))
-                start_pos = pos + 1
+        if "\n" in search_term:
+            return  # Matches never span lines
+
+        lowered = None
+        if not case_sensitive:
+            lowered = text.lower()
+            term_lowered = search_term.lower()
+            # lower() never shortens a string, so equal lengths mean every
+            # character mapped 1:1 and offsets in the copy match the text
+            if len(lowered) != len(text) or len(term_lowered) != len(search_term):
+                lowered = None
+            else:
+                search_term = term_lowered
+
+        if case_sensitive:
+            find = text.find
+        elif lowered is not None:
+            # str.find on a lowered copy is faster than an IGNORECASE regex
+            find = lowered.find
+        else:
+            # Lowercasing changed a length (e.g. 'İ'), so fold case inside
+            # re instead, which keeps match offsets aligned with the text
+            search = re.compile(re.escape(search_term), re.IGNORECASE).search
+
+            def find(_term: str, start: int = 0) -> int:
+                match = search(text, start)
+                return match.start() if match else -1
+
+        # Scan the whole text once, counting newlines between matches to
+        # track the line instead of splitting the text into lines
+        line = 0
+        line_start = 0
+        scanned = 0
+        pos = find(search_term)
+        while pos != -1:
+            newlines = text.count("\n", scanned, pos)
+            if newlines:
+                line += newlines
+                line_start = text.rfind("\n", scanned, pos) + 1
+            scanned = pos
+            # Add cursor at end of match
+            self.cursors.append(CursorPosition(line, pos - line_start + len(search_term)))
+            pos = find(search_term, pos + 1)
 
         # Sort cursors by position
         self._normalize_cursors()
@@ -132,9 +171,17 @@ class MultiCursorManager:
             line_delta: Number of lines to move (positive is down)
             column_delta: Number of columns to move (positive is right)
         """
-        for cursor in self.cursors:
-            cursor.line = max(0, cursor.line + line_delta)
-            cursor.column = max(0, cursor.column + column_delta)
+        # Most moves are along one axis, so only touch the coordinates that change
+        if line_delta and column_delta:
+            for cursor in self.cursors:
+                cursor.line = max(0, cursor.line + line_delta)
+                cursor.column = max(0, cursor.column + column_delta)
+        elif line_delta:
+            for cursor in self.cursors:
+                cursor.line = max(0, cursor.line + line_delta)
+        elif column_delta:
+            for cursor in self.cursors:
+                cursor.column = max(0, cursor.column + column_delta)
 
     def delete_at_all_cursors(self, text: str, delete_forward: bool = True) -> str:
         """Delete characters at all cursor positions.
@@ -149,21 +196,25 @@ class MultiCursorManager:
         if not self.cursors:
             return text
 
-        lines = text.split("\n")
-
-        # Process deletions from end to start to avoid position shifts
-        for cursor in sorted(self.cursors, reverse=True):
-            if 0 <= cursor.line < len(lines):
-                line = lines[cursor.line]
-                if delete_forward and cursor.column < len(line):
-                    # Delete forward
-                    lines[cursor.line] = line[: cursor.column] + line[cursor.column + 1 :]
-                elif not delete_forward and cursor.column > 0:
-                    # Delete backward
-                    lines[cursor.line] = line[: cursor.column - 1] + line[cursor.column :]
-                    cursor.column = max(0, cursor.column - 1)
-
-        return "\n".join(lines)
+        # Keep the text between deleted characters and join it once
+        parts = []
+        prev = 0
+        for cursor, line_start, line_end in self._cursor_lines(text):
+            if delete_forward:
+                offset = line_start + cursor.column
+            elif cursor.column > 0:
+                offset = line_start + cursor.column - 1
+                cursor.column -= 1
+            else:
+                continue
+
+            # Only characters within the line; each one is deleted once
+            if prev <= offset < line_end:
+                parts.append(text[prev:offset])
+                prev = offset + 1
+
+        parts.append(text[prev:])
+        return "".join(parts)
 
     def insert_at_all_cursors(self, text: str, insert_text: str) -> str:
         """Insert text at all cursor positions.
@@ -178,24 +229,65 @@ class MultiCursorManager:
         if not self.cursors:
             return text
 
-        lines = text.split("\n")
+        # Interleave the original text with the insertions and join it once
+        parts = []
+        prev = 0
+        for cursor, line_start, line_end in self._cursor_lines(text):
+            offset = min(line_start + cursor.column, line_end)
+            parts.append(text[prev:offset])
+            parts.append(insert_text)
+            prev = offset
+            cursor.column += len(insert_text)
+
+        parts.append(text[prev:])
+        return "".join(parts)
 
-        # Process insertions from end to start to avoid position shifts
-        for cursor in sorted(self.cursors, reverse=True):
-            if 0 <= cursor.line < len(lines):
-                line = lines[cursor.line]
-                lines[cursor.line] = line[: cursor.column] + insert_text + line[cursor.column :]
-                cursor.column += len(insert_text)
+    def _cursor_lines(self, text: str) -> List[Tuple[CursorPosition, int, int]]:
+        """Pair each cursor with the offsets of its line in the text.
 
-        return "\n".join(lines)
+        Cursors on lines past the end of the text or with a negative line or
+        column are left out.
+
+        Args:
+            text: The current text
+
+        Returns:
+            List of (cursor, line_start, line_end) in text order, where
+            line_end is the offset of the line's newline or the end of text
+        """
+        spans = []
+        line = 0
+        line_start = 0
+        line_end = text.find("\n")
+
+        for cursor in sorted(self.cursors, key=_POSITION_KEY):
+            if cursor.line < 0 or cursor.column < 0:
+                continue
+            while line < cursor.line:
+                if line_end == -1:
+                    return spans
+                line_start = line_end + 1
+                line_end = text.find("\n", line_start)
+                line += 1
+            spans.append((cursor, line_start, len(text) if line_end == -1 else line_end))
+
+        return spans
 
     def merge_overlapping_cursors(self) -> None:
         """Remove cursors that are at the same position."""
-        self.cursors = list(set(self.cursors))
+        # Sorting puts duplicates next to each other, so one pass drops them
+        self.cursors.sort(key=_POSITION_KEY)
+        merged: List[CursorPosition] = []
+        last_line = last_column = -1
+        for cursor in self.cursors:
+            if cursor.line != last_line or cursor.column != last_column:
+                merged.append(cursor)
+                last_line, last_column = cursor.line, cursor.column
+        self.cursors = merged
         self._normalize_cursors()
 
     def _normalize_cursors(self) -> None:
         """Sort cursors and ensure primary cursor index is valid."""
-        self.cursors.sort()
+        self.cursors.sort(key=_POSITION_KEY)
         if self.primary_cursor_index >= len(self.cursors):
             self.primary_cursor_index = max(0, len(self.cursors) - 1)
@@ -0,0 +1,138 @@
+"""Piece table text buffer for cheap insertions and deletions."""
+
+import bisect
+from typing import List, Optional
+
+
+class PieceTable:
+    """Text stored as an ordered list of immutable pieces.
+
+    Edits split pieces at the edit boundaries instead of copying the whole
+    text. The joined text is built lazily on read and cached until the next
+    edit; building it also collapses the pieces back into one.
+    """
+
+    def __init__(self, text: str = ""):
+        """Initialize the table with optional text.
+
+        Args:
+            text: Initial text
+        """
+        self._pieces: List[str] = [text] if text else []
+        self._starts: List[int] = [0] if text else []  # Offset of each piece
+        self._length = len(text)
+        self._text: Optional[str] = text
+
+    def __len__(self) -> int:
+        """Get the length of the text."""
+        return self._length
+
+    @property
+    def text(self) -> str:
+        """Get the full text, joining pieces only if edited since the last read."""
+        if self._text is None:
+            self._text = "".join(self._pieces)
+            self._pieces = [self._text] if self._text else []
+            self._starts = [0] if self._text else []
+        return self._text
+
+    def insert(self, pos: int, text: str) -> None:
+        """Insert text at a position.
+
+        Args:
+            pos: Offset to insert at
+            text: Text to insert
+
+        Raises:
+            ValueError: If pos is outside the text
+        """
+        if not 0 <= pos <= self._length:
+            raise ValueError(f"Invalid position {pos} for text of length {self._length}")
+        if not text:
+            return
+
+        index = self._split(pos)
+        self._pieces.insert(index, text)
+        self._starts.insert(index, pos)
+        self._shift_starts(index + 1, len(text))
+        self._length += len(text)
+        self._text = None
+
+    def delete(self, start: int, end: int) -> None:
+        """Delete the span text[start:end].
+
+        Args:
+            start: Start offset of the span
+            end: End offset (exclusive) of the span
+
+        Raises:
+            ValueError: If the span is outside the text
+        """
+        if not 0 <= start <= end <= self._length:
+            raise ValueError(f"Invalid span {start}:{end} for text of length {self._length}")
+        if start == end:
+            return
+
+        first = self._split(start)
+        last = self._split(end)
+        del self._pieces[first:last]
+        del self._starts[first:last]
+        self._shift_starts(first, start - end)
+        self._length -= end - start
+        self._text = None
+
+    def slice(self, start: int, end: int) -> str:
+        """Get text[start:end] without joining the whole text.
+
+        Args:
+            start: Start offset of the span
+            end: End offset (exclusive) of the span
+
+        Returns:
+            The text in the span
+        """
+        if self._text is not None:
+            return self._text[start:end]
+
+        start = max(start, 0)
+        end = min(end, self._length)
+        if start >= end:
+            return ""
+
+        index = bisect.bisect_right(self._starts, start) - 1
+        parts = []
+        while index < len(self._pieces) and self._starts[index] < end:
+            piece_start = self._starts[index]
+            parts.append(self._pieces[index][max(start - piece_start, 0) : end - piece_start])
+            index += 1
+        return "".join(parts)
+
+    def _split(self, pos: int) -> int:
+        """Ensure a piece boundary at pos.
+
+        Args:
+            pos: Offset within the text
+
+        Returns:
+            Index of the piece starting at pos (len(pieces) if pos is the end)
+        """
+        index = bisect.bisect_right(self._starts, pos) - 1
+        if index < 0:
+            return 0
+
+        offset = pos - self._starts[index]
+        piece = self._pieces[index]
+        if offset == 0:
+            return index
+        if offset == len(piece):
+            return index + 1
+
+        self._pieces[index : index + 1] = [piece[:offset], piece[offset:]]
+        self._starts.insert(index + 1, pos)
+        return index + 1
+
+    def _shift_starts(self, index: int, delta: int) -> None:
+        """Shift the offsets of all pieces from index onward by delta."""
+        starts = self._starts
+        for i in range(index, len(starts)):
+            starts[i] += delta
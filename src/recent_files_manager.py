@@ -1,9 +1,18 @@
 """Manager for tracking recently opened files."""
 
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
+from src.file_manager import FileManager
+
+# A stat slower than this (seconds) suggests a network or otherwise slow
+# filesystem; local stats take microseconds
+_SLOW_STAT_SECONDS = 0.005
+
 
 class RecentFilesManager:
     """Manages a list of recently opened files."""
@@ -23,6 +32,8 @@ class RecentFilesManager:
         self.config_dir = Path(config_dir)
         self.config_file = self.config_dir / "recent_files.json"
         self._recent_files: List[str] = []
+        # List as last read from or written to the config file, None if unknown
+        self._saved_files: Optional[List[str]] = None
 
         self._load_recent_files()
 
@@ -58,10 +69,29 @@ class RecentFilesManager:
     def get_existing_recent_files(self) -> List[str]:
         """Get recent files that still exist on disk.
 
+        Paths are checked one at a time, which is fastest on local disks. Once
+        a check turns out slow, the remaining paths are checked concurrently so
+        that network filesystem latencies overlap instead of adding up.
+
         Returns:
             List of existing file paths
         """
-        return [f for f in self._recent_files if Path(f).exists()]
+        files = self._recent_files
+        existing = []
+        for i, path in enumerate(files):
+            start = time.perf_counter()
+            # os.path.exists skips building a Path object for every entry
+            if os.path.exists(path):
+                existing.append(path)
+
+            if len(files) - i > 2 and time.perf_counter() - start > _SLOW_STAT_SECONDS:
+                rest = files[i + 1 :]
+                with ThreadPoolExecutor(max_workers=min(16, len(rest))) as executor:
+                    found = list(executor.map(os.path.exists, rest))
+                existing.extend(f for f, ok in zip(rest, found) if ok)
+                break
+
+        return existing
 
     def remove_file(self, file_path: str | Path) -> bool:
         """Remove a file from recent files.
@@ -96,17 +126,26 @@ class RecentFilesManager:
             with open(self.config_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 self._recent_files = data.get("recent_files", [])
+                self._saved_files = self._recent_files.copy()
         except (json.JSONDecodeError, IOError):
             self._recent_files = []
 
     def _save_recent_files(self) -> None:
-        """Save recent files to config file."""
+        """Save recent files to config file.
+
+        Nothing is written if the file already holds the current list, e.g. when
+        the most recent file is opened again. Otherwise the file is replaced
+        atomically, so a failed write never leaves it truncated.
+        """
+        if self._recent_files == self._saved_files:
+            return
+
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
 
             data = {"recent_files": self._recent_files}
 
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            FileManager.write_atomic(self.config_file, json.dumps(data, indent=2).encode("utf-8"))
+            self._saved_files = self._recent_files.copy()
         except IOError:
             pass
@@ -1,7 +1,24 @@
 """Smart indentation utilities for automatic indenting and bracket completion."""
 
 import re
-from typing import Tuple, Optional, Literal
+from functools import reduce
+from math import gcd
+from typing import Dict, List, Tuple, Optional, Literal
+
+from src.line_index import LineIndex
+
+# Leading spaces of every line that has some non-whitespace content
+_LEADING_SPACES = re.compile(r"^( ++)(?=[^\S\n]*\S)", re.MULTILINE)
+
+# Leading whitespace of any line; group 2 matches if the line is blank
+_LEADING_WHITESPACE = re.compile(r"^([^\S\n]+)($)?", re.MULTILINE)
+
+# A tab or a space at the start of any line
+_TAB_INDENT = re.compile(r"^\t", re.MULTILINE)
+_SPACE_INDENT = re.compile(r"^ ", re.MULTILINE)
+
+# Any bracket character
+_BRACKET_RE = re.compile(r"[()\[\]{}]")
 
 
 class SmartIndenter:
@@ -24,6 +41,10 @@ class SmartIndenter:
     # Keywords that typically should be dedented
     DEDENT_KEYWORDS = {"else", "elif", "except", "finally", "case"}
 
+    # Each keyword set compiled into one alternation, so a line is scanned once
+    INDENT_PATTERN = re.compile(r"\b(?:" + "|".join(sorted(INDENT_KEYWORDS)) + r")\b")
+    DEDENT_PATTERN = re.compile(r"^\s*(?:" + "|".join(sorted(DEDENT_KEYWORDS)) + r")\b")
+
     def __init__(self, indent_size: int = 4, use_spaces: bool = True):
         """Initialize smart indenter.
 
@@ -35,6 +56,11 @@ class SmartIndenter:
         self.use_spaces = use_spaces
         self.indent_char = " " if use_spaces else "\t"
         self.indent_string = self.indent_char * indent_size if use_spaces else self.indent_char
+        # Line index of the last text passed to auto_indent
+        self._line_index: Optional[LineIndex] = None
+        # Bracket pairs of the last text passed to find_matching_bracket
+        self._bracket_text: Optional[str] = None
+        self._bracket_pairs: Dict[int, int] = {}
 
     def detect_indent_size(self, text: str) -> int:
         """Detect the indentation size used in text.
@@ -45,27 +71,17 @@ class SmartIndenter:
         Returns:
             Detected indent size (2, 4, or 8)
         """
-        lines = text.split("\n")
-        indents = []
-
-        for line in lines:
-            if not line.strip():
-                continue
-            # Count leading spaces
-            spaces = len(line) - len(line.lstrip(" "))
-            if spaces > 0:
-                indents.append(spaces)
+        # Distinct widths are enough: repeated widths do not change the GCD
+        indents = {len(spaces) for spaces in _LEADING_SPACES.findall(text)}
 
         if not indents:
             return self.indent_size
 
         # Find greatest common divisor of all indents
         # Most common indent differences indicate size
-        from math import gcd
-        from functools import reduce
-
         if len(indents) == 1:
-            return indents[0] if indents[0] in [2, 4, 8] else self.indent_size
+            (indent,) = indents
+            return indent if indent in [2, 4, 8] else self.indent_size
 
         result = reduce(gcd, indents)
         return result if result in [2, 4, 8] else self.indent_size
@@ -79,15 +95,9 @@ class SmartIndenter:
         Returns:
             'spaces', 'tabs', or 'mixed'
         """
-        lines = text.split("\n")
-        has_tabs = False
-        has_spaces = False
-
-        for line in lines:
-            if line.startswith("\t"):
-                has_tabs = True
-            elif line.startswith(" "):
-                has_spaces = True
+        # Each search stops at its first hit instead of splitting every line
+        has_tabs = _TAB_INDENT.search(text) is not None
+        has_spaces = _SPACE_INDENT.search(text) is not None
 
         if has_tabs and has_spaces:
             return "mixed"
@@ -116,14 +126,20 @@ class SmartIndenter:
         Returns:
             The indentation level (number of indent units)
         """
-        indent = self.get_line_indent(line)
-        if not indent:
-            return 0
+        return self._indent_level(self.get_line_indent(line))
+
+    def _indent_level(self, indent: str) -> int:
+        """Get the indentation level of an indentation string.
+
+        Args:
+            indent: Leading whitespace of a line
 
+        Returns:
+            The indentation level (number of indent units)
+        """
         if "\t" in indent:
             return indent.count("\t")
-        else:
-            return len(indent) // self.indent_size
+        return len(indent) // self.indent_size
 
     def increase_indent(self, line: str) -> str:
         """Increase indentation of a line by one level.
@@ -171,41 +187,49 @@ class SmartIndenter:
         Returns:
             The appropriate indentation string
         """
-        lines = text.split("\n")
-
         if line_num == 0:
             return ""
 
+        # Reuse the index while the same text is passed in again
+        if self._line_index is None or self._line_index.text is not text:
+            self._line_index = LineIndex(text)
+        lines = self._line_index
+
         # Look at previous non-empty line
         prev_line = ""
         prev_indent = ""
-        for i in range(line_num - 1, -1, -1):
-            if i < len(lines) and lines[i].strip():
-                prev_line = lines[i]
+        for i in range(min(line_num, len(lines)) - 1, -1, -1):
+            line = lines.line(i)
+            if line and not line.isspace():
+                prev_line = line
                 prev_indent = self.get_line_indent(prev_line)
                 break
 
         if not prev_line:
             return ""
 
+        # Find the last non-whitespace character without copying the line;
+        # prev_line is not blank, so the scan stops inside it
+        end = len(prev_line)
+        while prev_line[end - 1].isspace():
+            end -= 1
+        last_char = prev_line[end - 1]
+
         # Check if previous line ends with opening bracket
-        stripped = prev_line.rstrip()
-        if stripped and stripped[-1] in self.OPENING_BRACKETS:
+        if last_char in self.OPENING_BRACKETS:
             return prev_indent + self.indent_string
 
         # Check if previous line has a keyword that triggers indentation
-        for keyword in self.INDENT_KEYWORDS:
-            if re.search(rf"\b{keyword}\b", prev_line) and prev_line.rstrip().endswith(":"):
-                return prev_indent + self.indent_string
+        if last_char == ":" and self.INDENT_PATTERN.search(prev_line):
+            return prev_indent + self.indent_string
 
         # Check if current line would be dedented (else, elif, except, etc.)
-        current_line = lines[line_num] if line_num < len(lines) else ""
-        for keyword in self.DEDENT_KEYWORDS:
-            if re.search(rf"^\s*{keyword}\b", current_line):
-                # Reduce indent level if applicable
-                level = self.get_indent_level(prev_indent)
-                if level > 0:
-                    return self.indent_string * (level - 1)
+        current_line = lines.line(line_num) if line_num < len(lines) else ""
+        if self.DEDENT_PATTERN.match(current_line):
+            # Reduce indent level if applicable
+            level = self._indent_level(prev_indent)
+            if level > 0:
+                return self.indent_string * (level - 1)
 
         return prev_indent
 
@@ -230,9 +254,38 @@ class SmartIndenter:
 
         return False, None
 
+    def build_bracket_pairs(self, text: str) -> Dict[int, int]:
+        """Pair every opening bracket in a text with its closing bracket.
+
+        Each bracket type is paired independently, so "([)]" pairs the
+        parentheses and the square brackets with each other.
+
+        Args:
+            text: The full text
+
+        Returns:
+            Dict mapping each matched opening position to its closing position
+        """
+        stacks: Dict[str, List[int]] = {opening: [] for opening in self.BRACKET_PAIRS}
+        pairs: Dict[int, int] = {}
+
+        for match in _BRACKET_RE.finditer(text):
+            char = match.group()
+            if char in self.BRACKET_PAIRS:
+                stacks[char].append(match.start())
+            else:
+                stack = stacks[self.REVERSE_PAIRS[char]]
+                if stack:
+                    pairs[stack.pop()] = match.start()
+
+        return pairs
+
     def find_matching_bracket(self, text: str, start_pos: int, opening: str) -> Optional[int]:
         """Find the matching closing bracket.
 
+        The bracket pairs of the text are computed once and reused until a
+        different text is passed.
+
         Args:
             text: The full text
             start_pos: Position of opening bracket
@@ -241,22 +294,14 @@ class SmartIndenter:
         Returns:
             Position of matching closing bracket, or None
         """
-        closing = self.BRACKET_PAIRS[opening]
-        level = 0
-        pos = start_pos
-
-        while pos < len(text):
-            char = text[pos]
-            if char == opening:
-                level += 1
-            elif char == closing:
-                level -= 1
-                if level == 0:
-                    return pos
+        if not 0 <= start_pos < len(text) or text[start_pos] != opening:
+            return None
 
-            pos += 1
+        if self._bracket_text is not text:
+            self._bracket_pairs = self.build_bracket_pairs(text)
+            self._bracket_text = text
 
-        return None
+        return self._bracket_pairs.get(start_pos)
 
     def get_bracket_completion(self, char: str) -> Optional[str]:
         """Get the completion character for a bracket.
@@ -291,25 +336,24 @@ class SmartIndenter:
         Returns:
             Text with normalized indentation
         """
-        lines = text.split("\n")
         target_char = " " if use_spaces else "\t"
         target_string = target_char * target_indent_size if use_spaces else target_char
 
-        result = []
-        for line in lines:
-            if not line.strip():
-                result.append("")
-                continue
+        # Files use few distinct indent strings, so map each one only once
+        new_indents: Dict[str, str] = {}
 
-            # Get current indentation level
-            level = self.get_indent_level(line)
-            content = line.lstrip()
+        def replace_indent(match: re.Match) -> str:
+            if match.group(2) is not None:
+                return ""  # Whitespace-only line
 
-            # Apply new indentation
-            new_indent = target_string * level
-            result.append(new_indent + content)
+            indent = match.group(1)
+            new_indent = new_indents.get(indent)
+            if new_indent is None:
+                new_indent = target_string * self._indent_level(indent)
+                new_indents[indent] = new_indent
+            return new_indent
 
-        return "\n".join(result)
+        return _LEADING_WHITESPACE.sub(replace_indent, text)
 
     def indent_selection(self, text: str, increase: bool = True) -> str:
         """Indent or dedent multiple lines.
@@ -321,16 +365,11 @@ class SmartIndenter:
         Returns:
             Text with adjusted indentation
         """
-        lines = text.split("\n")
-        result = []
+        if increase:
+            # Prefix every line: the indent goes at the start and after each newline
+            return self.indent_string + text.replace("\n", "\n" + self.indent_string)
 
-        for line in lines:
-            if increase:
-                result.append(self.increase_indent(line))
-            else:
-                result.append(self.decrease_indent(line))
-
-        return "\n".join(result)
+        return "\n".join([self.decrease_indent(line) for line in text.split("\n")])
 
     def format_docstring(self, text: str) -> str:
         """Format a docstring with proper indentation.
@@ -1,14 +1,79 @@
 """Snippet manager with built-in library and custom snippet support."""
 
+import heapq
 import json
 import os
-from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass, field, asdict
+import re
+import time
+from operator import attrgetter
+from typing import Any, List, Optional, Dict, Tuple
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 
+from src.file_manager import FileManager
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is the fallback
+    orjson = None
+
+# An integer of 19+ digits, which orjson may parse as a float
+_LONG_INTEGER = re.compile(rb"[0-9]{19}")
+
+# A ${name} placeholder; group 1 is the name
+_PLACEHOLDER_RE = re.compile(r"\$\{(\w+)\}")
+
+
+def _loads(content: bytes) -> Any:
+    """Parse UTF-8 JSON, trying orjson first when it is installed.
+
+    Anything orjson rejects, or may read differently (integers of 19 or more
+    digits), is handed to json.loads, which either accepts it or raises the
+    usual JSONDecodeError.
+
+    Args:
+        content: Encoded JSON content
+
+    Returns:
+        The parsed value
+    """
+    if orjson is not None and not _LONG_INTEGER.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON.
+
+    Compact output, used for the snippets file, goes through orjson when it is
+    installed. Indented output is meant for people and always comes from the
+    json module, so its layout never depends on the orjson version.
+
+    Args:
+        data: Value to serialize
+        pretty: Indent by two spaces instead of writing compactly
+
+    Returns:
+        Encoded JSON content
+    """
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits
+
+    # Compact output also lets json use its C encoder, which indent disables
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@dataclass(slots=True)
 class Snippet:
     """Represents a code snippet."""
 
@@ -38,30 +103,29 @@ class Snippet:
         Returns:
             List of placeholder names
         """
-        import re
-
-        matches = re.findall(r"\$\{(\w+)\}", self.content)
-        return matches
+        return _PLACEHOLDER_RE.findall(self.content)
 
     def expand(self, replacements: Optional[Dict[str, str]] = None) -> str:
         """Expand snippet with placeholder replacements.
 
+        All placeholders are replaced in a single pass, so replacement values
+        are inserted literally and never expanded themselves.
+
         Args:
             replacements: Dictionary of placeholder names to replacement values
 
         Returns:
             Expanded snippet content
         """
-        expanded = self.content
+        if not replacements:
+            return self.content
 
-        if replacements:
-            import re
+        return _PLACEHOLDER_RE.sub(lambda m: replacements.get(m.group(1), m.group(0)), self.content)
 
-            for placeholder, value in replacements.items():
-                pattern = r"\$\{" + re.escape(placeholder) + r"\}"
-                expanded = re.sub(pattern, value, expanded)
 
-        return expanded
+# Keys accepted from snippet JSON, and those every entry must have
+_SNIPPET_FIELDS = frozenset(f.name for f in fields(Snippet))
+_REQUIRED_FIELDS = frozenset({"name", "title", "content"})
 
 
 class SnippetManager:
@@ -185,6 +249,15 @@ class SnippetManager:
         ),
     }
 
+    # Built-in snippets keyed by their name, copied into each manager
+    _BUILTIN_BY_NAME: Dict[str, Snippet] = {s.name: s for s in BUILTIN_SNIPPETS.values()}
+
+    # Minimum seconds between saves triggered only by usage statistics
+    USAGE_SAVE_INTERVAL = 5.0
+
+    # Parsed snippets files by path, with the (mtime_ns, size, inode) they were read at
+    _parse_cache: Dict[Path, Tuple[Tuple[int, int, int], Any]] = {}
+
     def __init__(self, config_dir: Optional[str] = None):
         """Initialize snippet manager.
 
@@ -196,45 +269,81 @@ class SnippetManager:
 
         self.config_dir = Path(config_dir)
         self.snippets_file = self.config_dir / "snippets.json"
-        self.snippets: Dict[str, Snippet] = {}
-
         # Load built-in snippets
-        for snippet in self.BUILTIN_SNIPPETS.values():
-            self.snippets[snippet.name] = snippet
+        self.snippets: Dict[str, Snippet] = dict(self._BUILTIN_BY_NAME)
+        # Snippets grouped by language and by tag, plus lowercased search
+        # fields, built on first use and dropped whenever snippets are
+        # loaded, stored or removed; edit snippets through add_snippet
+        self._by_language: Optional[Dict[str, List[Snippet]]] = None
+        self._by_tag: Optional[Dict[str, List[Snippet]]] = None
+        self._search_fields: Optional[List[Tuple[Snippet, str, str, str]]] = None
+        # Usage statistics of custom snippets changed since the last save
+        self._usage_dirty = False
+        self._last_save = float("-inf")
 
         # Load custom snippets
         self._load_custom_snippets()
 
     def _load_custom_snippets(self) -> None:
-        """Load custom snippets from config file."""
-        if not self.snippets_file.exists():
+        """Load custom snippets from config file.
+
+        The parsed file is shared between managers and only parsed again once
+        the file on disk changes.
+        """
+        try:
+            st = self.snippets_file.stat()
+        except OSError:
             return
 
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._parse_cache.get(self.snippets_file)
+
         try:
-            with open(self.snippets_file, "r") as f:
-                data = json.load(f)
+            if cached is not None and cached[0] == key:
+                data = cached[1]
+            else:
+                data = _loads(self.snippets_file.read_bytes())
+                self._parse_cache[self.snippets_file] = (key, data)
 
-            for snippet_data in data.get("snippets", []):
-                snippet = self._dict_to_snippet(snippet_data)
-                self.snippets[snippet.name] = snippet
+            # Build every snippet first, then merge them over the built-ins at once
+            loaded = map(self._dict_to_snippet, data.get("snippets", []))
+            self.snippets.update({snippet.name: snippet for snippet in loaded if snippet is not None})
+            self._drop_indexes()
 
         except (json.JSONDecodeError, KeyError):
             pass
 
-    def _dict_to_snippet(self, data: Dict) -> Snippet:
+    def _dict_to_snippet(self, data: Dict) -> Optional[Snippet]:
         """Convert dictionary to Snippet object.
 
+        Unknown keys are ignored. Entries that are not objects, lack a required
+        field, have tags that are not a list of strings or carry an unreadable
+        timestamp are rejected.
+
         Args:
-            data: Dictionary with snippet data
+            data: Dictionary with snippet data; it is not modified
 
         Returns:
-            Snippet object
+            Snippet object, or None if the entry is invalid
         """
+        if not isinstance(data, dict) or not _REQUIRED_FIELDS <= data.keys():
+            return None
+
+        data = {key: value for key, value in data.items() if key in _SNIPPET_FIELDS}
+        if "tags" in data:
+            tags = data["tags"]
+            if not isinstance(tags, (list, tuple)) or not all(isinstance(tag, str) for tag in tags):
+                return None
+            data["tags"] = list(tags)
+
         # Convert timestamp strings back to datetime
-        if isinstance(data.get("created_at"), str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if isinstance(data.get("updated_at"), str):
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        try:
+            if isinstance(data.get("created_at"), str):
+                data["created_at"] = datetime.fromisoformat(data["created_at"])
+            if isinstance(data.get("updated_at"), str):
+                data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        except ValueError:
+            return None
 
         return Snippet(**data)
 
@@ -247,22 +356,44 @@ class SnippetManager:
         Returns:
             Dictionary representation
         """
-        data = asdict(snippet)
-        # Convert datetime to ISO format strings
-        data["created_at"] = snippet.created_at.isoformat()
-        data["updated_at"] = snippet.updated_at.isoformat()
-        return data
+        # Built by hand; asdict() deep-copies every field recursively
+        return {
+            "name": snippet.name,
+            "title": snippet.title,
+            "content": snippet.content,
+            "language": snippet.language,
+            "description": snippet.description,
+            "shortcut": snippet.shortcut,
+            "tags": list(snippet.tags),
+            # Convert datetime to ISO format strings
+            "created_at": snippet.created_at.isoformat(),
+            "updated_at": snippet.updated_at.isoformat(),
+            "usage_count": snippet.usage_count,
+            "custom": snippet.custom,
+        }
 
     def add_snippet(self, snippet: Snippet) -> None:
         """Add or update a snippet.
 
+        A stored snippet edited in place must be passed here again so that
+        language, tag and search lookups see the change.
+
         Args:
             snippet: The snippet to add
         """
+        self._store_snippet(snippet)
+        self._save_custom_snippets()
+
+    def _store_snippet(self, snippet: Snippet) -> None:
+        """Add or update a custom snippet in memory without saving.
+
+        Args:
+            snippet: The snippet to store
+        """
         snippet.custom = True
         snippet.updated_at = datetime.now()
         self.snippets[snippet.name] = snippet
-        self._save_custom_snippets()
+        self._drop_indexes()
 
     def remove_snippet(self, name: str) -> bool:
         """Remove a custom snippet.
@@ -281,6 +412,7 @@ class SnippetManager:
             return False
 
         del self.snippets[name]
+        self._drop_indexes()
         self._save_custom_snippets()
         return True
 
@@ -312,7 +444,12 @@ class SnippetManager:
         Returns:
             List of snippets for language
         """
-        return [s for s in self.snippets.values() if s.language == language or s.language == "text"]
+        by_language = self._language_index()
+        snippets = list(by_language.get(language, ()))
+        if language != "text":
+            # Language-neutral snippets apply everywhere
+            snippets.extend(by_language.get("text", ()))
+        return snippets
 
     def get_snippets_by_tag(self, tag: str) -> List[Snippet]:
         """Get snippets with a specific tag.
@@ -323,7 +460,7 @@ class SnippetManager:
         Returns:
             List of snippets with tag
         """
-        return [s for s in self.snippets.values() if tag in s.tags]
+        return list(self._tag_index().get(tag, ()))
 
     def search_snippets(self, query: str) -> List[Snippet]:
         """Search snippets by name, title, or description.
@@ -334,18 +471,15 @@ class SnippetManager:
         Returns:
             List of matching snippets
         """
-        query_lower = query.lower()
-        results = []
-
-        for snippet in self.snippets.values():
-            if (
-                query_lower in snippet.name.lower()
-                or query_lower in snippet.title.lower()
-                or query_lower in snippet.description.lower()
-            ):
-                results.append(snippet)
+        if self._search_fields is None:
+            self._build_indexes()
 
-        return results
+        query_lower = query.lower()
+        return [
+            snippet
+            for snippet, name, title, description in self._search_fields
+            if query_lower in name or query_lower in title or query_lower in description
+        ]
 
     def use_snippet(self, name: str, replacements: Optional[Dict[str, str]] = None) -> Optional[str]:
         """Use a snippet and expand it.
@@ -364,11 +498,20 @@ class SnippetManager:
         snippet.usage_count += 1
         snippet.updated_at = datetime.now()
 
+        # Usage alone is saved at most every USAGE_SAVE_INTERVAL seconds;
+        # flush() writes out whatever is still pending
         if snippet.custom:
-            self._save_custom_snippets()
+            self._usage_dirty = True
+            if time.monotonic() - self._last_save >= self.USAGE_SAVE_INTERVAL:
+                self._save_custom_snippets()
 
         return snippet.expand(replacements)
 
+    def flush(self) -> None:
+        """Save usage statistics that have not been written yet."""
+        if self._usage_dirty:
+            self._save_custom_snippets()
+
     def get_top_used_snippets(self, limit: int = 10) -> List[Tuple[Snippet, int]]:
         """Get most used snippets.
 
@@ -378,8 +521,9 @@ class SnippetManager:
         Returns:
             List of (snippet, usage_count) tuples
         """
-        sorted_snippets = sorted(self.snippets.values(), key=lambda s: s.usage_count, reverse=True)
-        return [(s, s.usage_count) for s in sorted_snippets[:limit]]
+        # Partial selection; ties keep their order, as with a stable sort
+        top_snippets = heapq.nlargest(limit, self.snippets.values(), key=attrgetter("usage_count"))
+        return [(s, s.usage_count) for s in top_snippets]
 
     def get_recent_snippets(self, limit: int = 10) -> List[Snippet]:
         """Get recently updated snippets.
@@ -390,8 +534,7 @@ class SnippetManager:
         Returns:
             List of recently updated snippets
         """
-        sorted_snippets = sorted(self.snippets.values(), key=lambda s: s.updated_at, reverse=True)
-        return sorted_snippets[:limit]
+        return heapq.nlargest(limit, self.snippets.values(), key=attrgetter("updated_at"))
 
     def get_languages(self) -> List[str]:
         """Get list of available languages.
@@ -399,11 +542,7 @@ class SnippetManager:
         Returns:
             List of language names
         """
-        languages = set()
-        for snippet in self.snippets.values():
-            if snippet.language != "text":
-                languages.add(snippet.language)
-        return sorted(languages)
+        return sorted(language for language in self._language_index() if language != "text")
 
     def get_tags(self) -> List[str]:
         """Get list of all tags used.
@@ -411,13 +550,59 @@ class SnippetManager:
         Returns:
             List of tag names
         """
-        tags = set()
+        return sorted(self._tag_index())
+
+    def _language_index(self) -> Dict[str, List[Snippet]]:
+        """Get snippets grouped by language, building the index if needed.
+
+        Returns:
+            Dictionary of language to snippets in insertion order
+        """
+        if self._by_language is None:
+            self._build_indexes()
+        return self._by_language
+
+    def _tag_index(self) -> Dict[str, List[Snippet]]:
+        """Get snippets grouped by tag, building the index if needed.
+
+        Returns:
+            Dictionary of tag to snippets in insertion order
+        """
+        if self._by_tag is None:
+            self._build_indexes()
+        return self._by_tag
+
+    def _build_indexes(self) -> None:
+        """Group snippets by language and tag and lowercase their search fields."""
+        by_language: Dict[str, List[Snippet]] = {}
+        by_tag: Dict[str, List[Snippet]] = {}
+        search_fields = []
+
         for snippet in self.snippets.values():
-            tags.update(snippet.tags)
-        return sorted(tags)
+            by_language.setdefault(snippet.language, []).append(snippet)
+            # A tag listed twice on one snippet still lists the snippet once
+            for tag in dict.fromkeys(snippet.tags):
+                by_tag.setdefault(tag, []).append(snippet)
+            search_fields.append(
+                (snippet, snippet.name.lower(), snippet.title.lower(), snippet.description.lower())
+            )
+
+        self._by_language = by_language
+        self._by_tag = by_tag
+        self._search_fields = search_fields
+
+    def _drop_indexes(self) -> None:
+        """Discard the indexes so the next lookup rebuilds them."""
+        self._by_language = None
+        self._by_tag = None
+        self._search_fields = None
 
     def _save_custom_snippets(self) -> None:
-        """Save custom snippets to file."""
+        """Save custom snippets to file.
+
+        The file is replaced atomically, so a failed write never leaves it
+        truncated.
+        """
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
         custom_snippets = [
@@ -426,15 +611,17 @@ class SnippetManager:
 
         data = {"snippets": custom_snippets, "version": "1.0"}
 
-        with open(self.snippets_file, "w") as f:
-            json.dump(data, f, indent=2)
+        FileManager.write_atomic(self.snippets_file, _dumps(data))
+        self._usage_dirty = False
+        self._last_save = time.monotonic()
 
-    def export_snippets(self, filepath: str, custom_only: bool = True) -> bool:
+    def export_snippets(self, filepath: str, custom_only: bool = True, pretty: bool = False) -> bool:
         """Export snippets to a file.
 
         Args:
             filepath: Path to export to
             custom_only: Only export custom snippets
+            pretty: Indent the JSON for reading instead of writing it compactly
 
         Returns:
             True if successful
@@ -448,8 +635,8 @@ class SnippetManager:
 
             data = {"snippets": snippets_to_export, "version": "1.0"}
 
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(filepath, "wb") as f:
+                f.write(_dumps(data, pretty))
 
             return True
 
@@ -464,33 +651,42 @@ class SnippetManager:
             overwrite: Overwrite existing snippets with same name
 
         Returns:
-            Tuple of (imported_count, skipped_count)
+            Tuple of (imported_count, skipped_count); invalid entries are skipped
         """
         imported = 0
         skipped = 0
 
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                data = _loads(f.read())
 
             for snippet_data in data.get("snippets", []):
                 snippet = self._dict_to_snippet(snippet_data)
 
-                if snippet.name in self.snippets and not overwrite:
+                if snippet is None or (snippet.name in self.snippets and not overwrite):
                     skipped += 1
                     continue
 
-                self.add_snippet(snippet)
+                self._store_snippet(snippet)
                 imported += 1
 
-            return imported, skipped
-
         except (IOError, OSError, json.JSONDecodeError, KeyError):
-            return imported, skipped
+            pass
+
+        # Save once for the whole batch, including snippets stored before an error
+        if imported:
+            try:
+                self._save_custom_snippets()
+            except OSError:
+                pass
+
+        return imported, skipped
 
     def clear_usage_stats(self) -> None:
         """Clear usage statistics for all snippets."""
         for snippet in self.snippets.values():
+            if snippet.custom and snippet.usage_count:
+                self._usage_dirty = True
             snippet.usage_count = 0
 
     def get_statistics(self) -> Dict:
@@ -500,11 +696,18 @@ class SnippetManager:
             Dictionary with statistics
         """
         total_snippets = len(self.snippets)
-        custom_count = sum(1 for s in self.snippets.values() if s.custom)
+        custom_count = 0
+        total_uses = 0
+        for snippet in self.snippets.values():
+            if snippet.custom:
+                custom_count += 1
+            total_uses += snippet.usage_count
         builtin_count = total_snippets - custom_count
-        total_uses = sum(s.usage_count for s in self.snippets.values())
-        languages = len(self.get_languages())
-        tags = len(self.get_tags())
+
+        # Counted from the indexes, without sorting the names
+        by_language = self._language_index()
+        languages = len(by_language) - ("text" in by_language)
+        tags = len(self._tag_index())
 
         return {
             "total_snippets": total_snippets,
@@ -1,6 +1,6 @@
 """Tab manager for handling multiple document tabs."""
 
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from src.document import Document
 
 
@@ -11,6 +11,9 @@ class TabManager:
         """Initialize the tab manager."""
         self._documents: List[Document] = []
         self._active_index = -1
+        # Number of open documents with unsaved changes, kept current by
+        # the documents' modified listeners
+        self._modified_count = 0
 
     def add_tab(self, document: Optional[Document] = None) -> int:
         """Add a new tab with a document.
@@ -25,6 +28,7 @@ class TabManager:
             document = Document()
 
         self._documents.append(document)
+        self._watch(document)
         new_index = len(self._documents) - 1
 
         # Activate the new tab if no active tab exists
@@ -46,10 +50,13 @@ class TabManager:
             return False
 
         if 0 <= index < len(self._documents):
-            self._documents.pop(index)
+            self._unwatch(self._documents.pop(index))
 
-            # Adjust active index
-            if self._active_index >= len(self._documents):
+            # Keep the same document active when a tab before it closes;
+            # closing the active tab activates the one that took its place
+            if index < self._active_index:
+                self._active_index -= 1
+            elif self._active_index >= len(self._documents):
                 self._active_index = len(self._documents) - 1
 
             return True
@@ -115,20 +122,51 @@ class TabManager:
     def get_all_documents(self) -> List[Document]:
         """Get all documents.
 
+        Callers that only loop over the documents should use iter_documents,
+        which does not copy the list.
+
         Returns:
             List of all open documents
         """
         return self._documents.copy()
 
+    def iter_documents(self) -> Iterator[Document]:
+        """Iterate over all documents in tab order without copying them.
+
+        Tabs must not be added or closed while iterating.
+
+        Returns:
+            Iterator over the open documents
+        """
+        return iter(self._documents)
+
     def has_unsaved_changes(self) -> bool:
         """Check if any tab has unsaved changes.
 
         Returns:
             True if any document is modified
         """
-        return any(doc.is_modified for doc in self._documents)
+        return self._modified_count > 0
 
     def clear(self) -> None:
         """Clear all tabs and reset state."""
+        for document in self._documents:
+            self._unwatch(document)
         self._documents.clear()
         self._active_index = -1
+
+    def _watch(self, document: Document) -> None:
+        """Start counting a document's unsaved changes."""
+        document.add_modified_listener(self._on_modified_changed)
+        if document.is_modified:
+            self._modified_count += 1
+
+    def _unwatch(self, document: Document) -> None:
+        """Stop counting a document's unsaved changes."""
+        document.remove_modified_listener(self._on_modified_changed)
+        if document.is_modified:
+            self._modified_count -= 1
+
+    def _on_modified_changed(self, modified: bool) -> None:
+        """Update the unsaved count when a document's modified state flips."""
+        self._modified_count += 1 if modified else -1
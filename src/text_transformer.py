@@ -3,6 +3,12 @@
 import re
 from typing import List, Literal
 
+# Word separators for camelCase conversion
+_CAMEL_SPLIT = re.compile(r"[_\s-]+")
+# Word boundaries for snake_case conversion: a run of separators, or the
+# position before an uppercase letter that does not follow one (or the start)
+_SNAKE_BOUNDARY = re.compile(r"[\s_-]+|(?<!^)(?<![\s_-])(?=[A-Z])")
+
 
 class TextTransformer:
     """Provides text transformation operations for editing."""
@@ -54,7 +60,7 @@ class TextTransformer:
             Text in camelCase
         """
         # Split by underscores, spaces, or hyphens
-        words = re.split(r"[_\s-]+", text.strip())
+        words = _CAMEL_SPLIT.split(text.strip())
         if not words:
             return text
 
@@ -71,12 +77,9 @@ class TextTransformer:
         Returns:
             Text in snake_case
         """
-        # Insert underscore before uppercase letters (for camelCase)
-        text = re.sub(r"(?<!^)(?=[A-Z])", "_", text)
-        # Replace spaces and hyphens with underscores
-        text = re.sub(r"[\s-]+", "_", text)
-        # Remove extra underscores and convert to lowercase
-        text = re.sub(r"_+", "_", text)
+        # One underscore per boundary: before uppercase letters (for
+        # camelCase) and in place of spaces, hyphens and underscores
+        text = _SNAKE_BOUNDARY.sub("_", text)
         return text.lower().strip("_")
 
     @staticmethod
@@ -108,9 +111,14 @@ class TextTransformer:
         Returns:
             Text with trimmed lines
         """
-        lines = text.split("\n")
-        trimmed_lines = [TextTransformer.trim_whitespace(line, mode) for line in lines]
-        return "\n".join(trimmed_lines)
+        # Pick the strip method once instead of dispatching on mode per line
+        if mode == "leading":
+            strip = str.lstrip
+        elif mode == "trailing":
+            strip = str.rstrip
+        else:
+            strip = str.strip
+        return "\n".join(list(map(strip, text.split("\n"))))
 
     @staticmethod
     def sort_lines(text: str, reverse: bool = False, by_length: bool = False) -> str:
@@ -160,13 +168,8 @@ class TextTransformer:
         lines = text.split("\n")
 
         if preserve_order:
-            seen = set()
-            unique_lines = []
-            for line in lines:
-                if line not in seen:
-                    seen.add(line)
-                    unique_lines.append(line)
-            return "\n".join(unique_lines)
+            # dict keys keep insertion order, so this keeps first occurrences
+            return "\n".join(dict.fromkeys(lines))
         else:
             return "\n".join(sorted(set(lines)))
 
@@ -181,7 +184,7 @@ class TextTransformer:
             Text without empty lines
         """
         lines = text.split("\n")
-        return "\n".join(line for line in lines if line.strip())
+        return "\n".join([line for line in lines if line and not line.isspace()])
 
     @staticmethod
     def indent_lines(text: str, indent: int = 4, char: str = " ") -> str:
@@ -196,8 +199,8 @@ class TextTransformer:
             Text with added indentation
         """
         indent_str = char * indent
-        lines = text.split("\n")
-        return "\n".join(indent_str + line for line in lines)
+        # Prefix the first line and every line after a newline in one pass
+        return indent_str + text.replace("\n", "\n" + indent_str)
 
     @staticmethod
     def dedent_lines(text: str, indent: int = 4, char: str = " ") -> str:
@@ -249,7 +252,7 @@ class TextTransformer:
             Single-line text
         """
         lines = text.split("\n")
-        return separator.join(line.strip() for line in lines if line.strip())
+        return separator.join([line for line in map(str.strip, lines) if line])
 
     @staticmethod
     def split_line(text: str, length: int = 80, separator: str = "\n") -> str:
@@ -317,8 +320,7 @@ class TextTransformer:
         Returns:
             Text with trailing whitespace removed
         """
-        lines = text.split("\n")
-        return "\n".join(line.rstrip() for line in lines)
+        return "\n".join(list(map(str.rstrip, text.split("\n"))))
 
     @staticmethod
     def remove_leading_whitespace(text: str) -> str:
@@ -330,8 +332,7 @@ class TextTransformer:
         Returns:
             Text with leading whitespace removed
         """
-        lines = text.split("\n")
-        return "\n".join(line.lstrip() for line in lines)
+        return "\n".join(list(map(str.lstrip, text.split("\n"))))
 
     @staticmethod
     def count_words(text: str) -> int:
@@ -371,5 +372,6 @@ class TextTransformer:
             Number of characters
         """
         if exclude_whitespace:
-            return len(text.replace(" ", "").replace("\n", "").replace("\t", ""))
+            # Counting needs no copies, unlike removing the whitespace first
+            return len(text) - text.count(" ") - text.count("\n") - text.count("\t")
         return len(text)
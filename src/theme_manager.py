@@ -1,14 +1,19 @@
 """Theme management system for jText with light and dark modes."""
 
 import json
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Optional, Literal
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColorScheme:
-    """Color scheme for a theme."""
+    """Color scheme for a theme.
+
+    Schemes are frozen because the built-in themes share one instance across
+    every ThemeManager; use dataclasses.replace to derive a modified scheme.
+    """
 
     # Editor colors
     background: str
@@ -50,7 +55,7 @@ class ColorScheme:
 
     def to_dict(self) -> Dict[str, str]:
         """Convert to dictionary."""
-        return self.__dict__.copy()
+        return dict(zip(_COLOR_FIELDS, _get_colors(self)))
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> "ColorScheme":
@@ -58,6 +63,11 @@ class ColorScheme:
         return cls(**data)
 
 
+# Field names in declaration order, and a getter returning all values at once
+_COLOR_FIELDS = tuple(f.name for f in fields(ColorScheme))
+_get_colors = attrgetter(*_COLOR_FIELDS)
+
+
 class Theme:
     """Represents a complete theme."""
 
@@ -188,6 +198,8 @@ class ThemeManager:
             "light": self.LIGHT_THEME,
             "dark": self.DARK_THEME,
         }
+        # Generated stylesheets keyed by their (frozen) color scheme
+        self._stylesheets: Dict[ColorScheme, str] = {}
         self.current_theme = self._load_current_theme()
 
     def _load_current_theme(self) -> Theme:
@@ -340,8 +352,24 @@ class ThemeManager:
             theme = self.current_theme
 
         colors = theme.colors
+        # Keyed on the color values, so unregistered themes that share a name
+        # with a cached one still get their own stylesheet
+        stylesheet = self._stylesheets.get(colors)
+        if stylesheet is None:
+            stylesheet = self._stylesheets[colors] = self._build_stylesheet(colors)
+        return stylesheet
+
+    @staticmethod
+    def _build_stylesheet(colors: ColorScheme) -> str:
+        """Build the Qt stylesheet for a color scheme.
 
-        stylesheet = f"""
+        Args:
+            colors: Color scheme to use
+
+        Returns:
+            Stylesheet string
+        """
+        return f"""
         QMainWindow {{
             background-color: {colors.background};
             color: {colors.foreground};
@@ -434,4 +462,3 @@ class ThemeManager:
             alternate-background-color: {colors.current_line_bg};
         }}
         """
-        return stylesheet
@@ -1173,3 +1173,8 @@ class MainWindow(QMainWindow):
                 content = self.snippet_manager.use_snippet(snippet.name)
                 if content:
                     text_edit.insertPlainText(content)
+
+    def closeEvent(self, event):
+        """Write pending snippet usage statistics before the window closes."""
+        self.snippet_manager.flush()
+        super().closeEvent(event)
@@ -1,8 +1,15 @@
 """Visual indicators for whitespace, line endings, and other editor features."""
 
+import re
 from enum import Enum
 from typing import Literal
 
+# Run of leading spaces; matching it measures indentation without an lstrip() copy
+_LEADING_SPACES = re.compile(r" *")
+
+# Any line containing a tab, matched once per line without splitting the text
+_LINE_WITH_TAB = re.compile(r"^[^\t\n]*\t", re.MULTILINE)
+
 
 class LineEnding(Enum):
     """Line ending types."""
@@ -161,7 +168,7 @@ class WhitespaceAnalyzer:
         """
         if not text:
             return 0
-        return sum(1 for line in text.split("\n") if "\t" in line)
+        return len(_LINE_WITH_TAB.findall(text))
 
     @staticmethod
     def count_lines_with_spaces(text: str, min_spaces: int = 2) -> int:
@@ -177,13 +184,9 @@ class WhitespaceAnalyzer:
         if not text:
             return 0
 
-        count = 0
-        for line in text.split("\n"):
-            # Check if line starts with spaces
-            stripped = line.lstrip()
-            if stripped and line.startswith(" " * min_spaces):
-                count += 1
-        return count
+        # Lines starting with the spaces that also have non-whitespace content
+        pattern = re.compile("^" + " " * min_spaces + r"[^\S\n]*\S", re.MULTILINE)
+        return len(pattern.findall(text))
 
     @staticmethod
     def get_indentation_style(text: str) -> Literal["tabs", "spaces", "mixed", "none"]:
@@ -228,9 +231,9 @@ class WhitespaceAnalyzer:
             if not line or not line[0].isspace():
                 continue
 
-            # Count leading spaces
-            spaces = len(line) - len(line.lstrip(" "))
-            if spaces > 0 and line[spaces] != "\t":
+            # Count leading spaces (whitespace-only lines don't count)
+            spaces = _LEADING_SPACES.match(line).end()
+            if 0 < spaces < len(line) and line[spaces] != "\t":
                 indent_counts[spaces] = indent_counts.get(spaces, 0) + 1
 
         if not indent_counts:
@@ -0,0 +1,45 @@
+"""Shared fixtures for the test suite."""
+
+import json
+
+import pytest
+
+
+class StubOrjson:
+    """Stand-in for the optional orjson module, built on the json module.
+
+    Like orjson it rejects NaN and Infinity and returns bytes from dumps.
+    Every call is recorded so tests can check which backend did the work.
+    """
+
+    JSONDecodeError = json.JSONDecodeError
+    OPT_INDENT_2 = 1
+
+    class JSONEncodeError(TypeError):
+        """Raised for values orjson cannot serialize."""
+
+    def __init__(self):
+        """Initialize with no recorded calls."""
+        self.calls = []
+
+    def loads(self, content):
+        """Parse JSON text or UTF-8 bytes."""
+        self.calls.append("loads")
+
+        def reject(name):
+            raise json.JSONDecodeError(f"unexpected {name}", "", 0)
+
+        return json.loads(content, parse_constant=reject)
+
+    def dumps(self, data, option=None):
+        """Serialize to UTF-8 bytes, compactly or with two-space indents."""
+        self.calls.append("dumps")
+        if option == self.OPT_INDENT_2:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode()
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@pytest.fixture
+def stub_orjson():
+    """Provide a fresh StubOrjson; tests patch it into the module under test."""
+    return StubOrjson()
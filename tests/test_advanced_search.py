@@ -1,7 +1,9 @@
 """Unit tests for advanced search engine."""
 
+import dataclasses
 import pytest
 import re
+from datetime import datetime
 from src.advanced_search import AdvancedSearchEngine, SearchQuery, SearchResult
 
 
@@ -40,6 +42,24 @@ class TestSearchQuery:
         query_set = {q1, q2}
         assert len(query_set) == 2
 
+    def test_search_query_ignores_timestamp(self):
+        """Test that equality and hashing ignore the timestamp."""
+        q1 = SearchQuery(pattern="hello")
+        q2 = SearchQuery(pattern="hello", timestamp=datetime(2000, 1, 1))
+
+        assert q1 == q2
+        assert hash(q1) == hash(q2)
+
+    def test_search_query_immutable(self):
+        """Test that queries and results cannot be modified in place."""
+        query = SearchQuery(pattern="hello")
+        result = SearchResult(start=0, end=5, line_num=0, column=0, match_text="hello")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            query.pattern = "world"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.start = 1
+
 
 class TestSearchEngineBasic:
     """Test basic search engine functionality."""
@@ -158,6 +178,22 @@ class TestWholeWordSearch:
 
         assert len(results) == 3
 
+    def test_whole_words_pattern_with_punctuation(self):
+        """Test whole words for patterns that begin with a non-word character."""
+        engine = AdvancedSearchEngine()
+        query = SearchQuery(pattern="$100", whole_words=True)
+        results = engine.search("$100 a$100 $1000 ($100)", query)
+
+        assert [r.start for r in results] == [0, 18]
+
+    def test_literal_special_chars_case_insensitive(self):
+        """Test literal search escapes regex syntax and keeps original casing."""
+        engine = AdvancedSearchEngine()
+        query = SearchQuery(pattern="A.B")
+        results = engine.search("axb a.b A.B", query)
+
+        assert [r.match_text for r in results] == ["a.b", "A.B"]
+
 
 class TestRegexSearch:
     """Test regex search functionality."""
@@ -220,6 +256,14 @@ class TestRegexSearch:
 
         assert len(results) == 1
 
+    def test_regex_whole_words_alternation(self):
+        """Test that whole words applies to every branch of an alternation."""
+        engine = AdvancedSearchEngine()
+        query = SearchQuery(pattern=r"cat|dog", regex=True, whole_words=True)
+        results = engine.search("cat catalog dog hotdog", query)
+
+        assert [r.start for r in results] == [0, 12]
+
     def test_regex_quantifiers(self):
         """Test regex quantifiers."""
         engine = AdvancedSearchEngine()
@@ -334,6 +378,17 @@ class TestReplace:
 
         assert count == 3
 
+    def test_replace_all_replacement_is_literal(self):
+        """Test that replacement text is inserted verbatim, even for regex queries."""
+        engine = AdvancedSearchEngine()
+        query = SearchQuery(pattern=r"(\d+)", regex=True)
+        text = "a1b22c"
+
+        modified, count = engine.replace(text, query, r"<\1>", replace_all=True)
+
+        assert count == 2
+        assert modified == r"a<\1>b<\1>c"
+
     def test_replace_regex(self):
         """Test replace with regex pattern."""
         engine = AdvancedSearchEngine()
@@ -383,6 +438,15 @@ class TestSearchHistory:
         history = engine.get_history()
         assert len(history) <= 3
 
+    def test_history_order_most_recent_first(self):
+        """Test that a repeated query moves to the front and oldest entries drop."""
+        engine = AdvancedSearchEngine(max_history=3)
+
+        for pattern in ["a", "b", "c", "a", "d"]:
+            engine.search("text", SearchQuery(pattern=pattern))
+
+        assert [q.pattern for q in engine.get_history()] == ["d", "a", "c"]
+
     def test_no_duplicate_history(self):
         """Test that duplicate queries are moved to front."""
         engine = AdvancedSearchEngine()
@@ -414,6 +478,28 @@ class TestSearchHistory:
 
         assert len(engine.get_history()) == 0
 
+    def test_compiled_pattern_reused(self):
+        """Test that repeated searches reuse the compiled pattern."""
+        engine = AdvancedSearchEngine()
+        engine.clear_history()
+        query = SearchQuery(pattern=r"\d+", regex=True)
+
+        engine.search("a 1 b 2", query)
+        engine.search("c 3", SearchQuery(pattern=r"\d+", regex=True))
+
+        info = engine._compile.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_clear_history_clears_pattern_cache(self):
+        """Test that clearing history also drops compiled patterns."""
+        engine = AdvancedSearchEngine()
+        engine.search("hello", SearchQuery(pattern="hello"))
+
+        engine.clear_history()
+
+        assert engine._compile.cache_info().currsize == 0
+
 
 class TestHighlightResults:
     """Test highlight results functionality."""
@@ -482,6 +568,30 @@ class TestResultMetadata:
         assert result.line_num == 1
         assert result.column == 6
 
+    def test_search_result_line_boundaries(self):
+        """Test line and column for matches at line starts and after blank lines."""
+        engine = AdvancedSearchEngine()
+        text = "\nab\n\nab\nxab"
+
+        literal = engine.search(text, SearchQuery(pattern="ab"))
+        regex = engine.search(text, SearchQuery(pattern="a.", regex=True))
+
+        for results in (literal, regex):
+            assert [(r.line_num, r.column) for r in results] == [(1, 0), (3, 0), (4, 1)]
+
+    def test_line_index_reused_for_same_text(self):
+        """Test that the newline index is rebuilt only when the text changes."""
+        engine = AdvancedSearchEngine()
+        text = "a\nb\na"
+
+        engine.search(text, SearchQuery(pattern="a"))
+        index = engine._line_index
+        engine.search(text, SearchQuery(pattern="b"))
+        assert engine._line_index is index
+
+        results = engine.search("x\n\na", SearchQuery(pattern="a"))
+        assert results[0].line_num == 2
+
     def test_get_result_count(self):
         """Test getting result count."""
         engine = AdvancedSearchEngine()
@@ -611,3 +721,13 @@ line5"""
         # Based on implementation, it will find both
         assert len(results) >= 1
 
+    def test_case_sensitive_literal_matches_regex_path(self):
+        """Test that the substring fast path agrees with the regex path."""
+        engine = AdvancedSearchEngine()
+        text = "ab\nabab aaa\n\nxab"
+
+        for pattern in ["ab", "aa", "a", "\n", "b\na"]:
+            fast = engine.search(text, SearchQuery(pattern=pattern, case_sensitive=True))
+            regex = engine.search(text, SearchQuery(pattern=re.escape(pattern), case_sensitive=True, regex=True))
+            assert fast == regex
+
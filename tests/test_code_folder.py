@@ -195,6 +195,23 @@ except Exception:
         block_regions = [r for r in regions if r.region_type == "block"]
         assert len(block_regions) > 0
 
+    def test_keyword_alone_does_not_match_next_line(self):
+        """Test that a bare keyword line isn't joined with the following line."""
+        code = "class\n    Foo\nif\n    x = 1\n"
+        folder = CodeFolder()
+        regions = folder.analyze(code)
+
+        assert [r for r in regions if r.region_type != "indent"] == []
+
+    def test_region_start_lines_after_blank_lines(self):
+        """Test region start lines are correct when blank lines precede them."""
+        code = "\n\n# a\n# b\n\nclass A:\n    def f(self):\n        pass\n"
+        folder = CodeFolder()
+        regions = folder.analyze(code)
+
+        starts = {(r.region_type, r.start_line, r.end_line) for r in regions if r.region_type != "indent"}
+        assert starts == {("comment", 2, 3), ("class", 5, 8), ("function", 6, 8)}
+
 
 class TestCommentDetection:
     """Test comment block detection."""
@@ -290,6 +307,46 @@ class B:
             nested = folder.get_nested_regions(parent)
             # Should have at least the method inside the class
 
+    def test_region_queries_with_assigned_regions(self):
+        """Test queries on unsorted, directly assigned and appended regions."""
+        folder = CodeFolder()
+        outer = FoldRegion(0, 20, 0, "class")
+        late = FoldRegion(10, 12, 2, "block")
+        inner = FoldRegion(2, 5, 1, "function")
+        folder.regions = [outer, late, inner]
+
+        assert folder.get_regions_at_line(3) == [outer, inner]
+        assert folder.get_regions_at_line(11) == [outer, late]
+        assert folder.get_regions_at_line(21) == []
+        assert folder.get_nested_regions(outer) == [late, inner]
+
+        extra = FoldRegion(3, 4, 2, "block")
+        folder.regions.append(extra)
+        assert folder.get_regions_at_line(3) == [outer, inner, extra]
+        assert folder.get_nested_regions(inner) == [extra]
+
+    def test_region_queries_after_in_place_changes(self):
+        """Test queries after regions are moved, replaced or reordered in place."""
+        folder = CodeFolder()
+        outer = FoldRegion(0, 20, 0, "class")
+        inner = FoldRegion(2, 5, 1, "function")
+        folder.regions = [outer, inner]
+        assert folder.get_regions_at_line(3) == [outer, inner]
+
+        inner.start_line = 30
+        inner.end_line = 40
+        assert folder.get_regions_at_line(3) == [outer]
+        assert folder.get_regions_at_line(35) == [inner]
+
+        moved = FoldRegion(3, 4, 1, "block")
+        folder.regions[1] = moved
+        assert folder.get_regions_at_line(3) == [outer, moved]
+        assert folder.get_regions_at_line(35) == []
+
+        folder.regions.reverse()
+        assert folder.get_regions_at_line(3) == [moved, outer]
+        assert folder.get_nested_regions(outer) == [moved]
+
 
 class TestFoldToggle:
     """Test fold toggling."""
@@ -396,6 +453,17 @@ class TestVisibleLines:
         assert 3 not in visible
         assert 4 in visible
 
+    def test_get_visible_lines_region_past_end(self):
+        """Test that a folded region reaching past the text end is clipped."""
+        text = "0\n1\n2"
+        folder = CodeFolder()
+        folder.regions = [
+            FoldRegion(1, 10, 0, "block", is_folded=True),
+            FoldRegion(5, 8, 0, "block", is_folded=True),
+        ]
+
+        assert folder.get_visible_lines(text) == [0, 1]
+
     def test_get_visible_lines_multiple_folds(self):
         """Test visible lines with multiple folded regions."""
         text = "0\n1\n2\n3\n4\n5\n6\n7\n8\n9"
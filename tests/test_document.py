@@ -68,6 +68,28 @@ class TestDocumentContent:
         doc.mark_saved()
         assert not doc.is_modified
 
+    def test_undo_to_saved_state_not_modified(self):
+        """Test that undoing back to the saved state clears the modified flag."""
+        doc = Document("initial")
+        doc.content = "changed"
+        doc.content = "changed again"
+        doc.undo()
+        assert doc.is_modified
+        doc.undo()
+        assert not doc.is_modified
+        doc.redo()
+        assert doc.is_modified
+
+    def test_new_edit_after_undo_is_modified(self):
+        """Test that a new edit never reuses the saved version."""
+        doc = Document("a")
+        doc.content = "b"
+        doc.undo()
+        doc.content = "c"
+        assert doc.is_modified
+        doc.undo()
+        assert not doc.is_modified
+
     def test_mark_saved_resets_undo_redo(self):
         """Test that mark_saved clears undo/redo stacks."""
         doc = Document("initial")
@@ -76,6 +98,26 @@ class TestDocumentContent:
         doc.mark_saved()
         assert not doc.can_undo()
 
+    def test_modified_listener(self):
+        """Test that listeners hear each flip of the modified state once."""
+        doc = Document("a")
+        events = []
+        doc.add_modified_listener(events.append)
+
+        doc.content = "b"
+        doc.content = "c"
+        doc.undo()
+        doc.undo()
+        doc.redo()
+        doc.mark_saved()
+        doc.content = "d"
+        doc.clear()
+        assert events == [True, False, True, False, True, False]
+
+        doc.remove_modified_listener(events.append)
+        doc.content = "e"
+        assert len(events) == 6
+
 
 class TestFilePath:
     """Test Document file path management."""
@@ -180,6 +222,68 @@ class TestUndoRedo:
         assert doc.redo()  # forward to v3
         assert doc.content == "v3"
 
+    def test_undo_history_stores_only_changed_span(self):
+        """Test that undo history records the edited span, not the whole content."""
+        doc = Document("a" * 1000)
+        doc.content = "a" * 500 + "XY" + "a" * 500
+
+        assert doc._undo_stack == [(500, 502, "", 0)]
+        assert doc.undo()
+        assert doc.content == "a" * 1000
+
+    def test_undo_redo_repeated_characters(self):
+        """Test edits inside runs of identical characters round-trip."""
+        doc = Document("aaa\nbbb")
+        doc.content = "aa\nbbbb"
+        doc.content = "aaaa\nbbbb"
+        assert doc.undo()
+        assert doc.content == "aa\nbbbb"
+        assert doc.undo()
+        assert doc.content == "aaa\nbbb"
+        assert doc.redo()
+        assert doc.redo()
+        assert doc.content == "aaaa\nbbbb"
+
+
+class TestApplyEdit:
+    """Test Document span edits."""
+
+    def test_apply_edit_insert(self):
+        """Test inserting text with an empty span."""
+        doc = Document("hello world")
+        doc.apply_edit(5, 5, ",")
+        assert doc.content == "hello, world"
+        assert doc.is_modified
+
+    def test_apply_edit_replace_and_undo(self):
+        """Test replacing a span and undoing it."""
+        doc = Document("hello world")
+        doc.apply_edit(6, 11, "there")
+        assert doc.content == "hello there"
+        assert doc.undo()
+        assert doc.content == "hello world"
+        assert doc.redo()
+        assert doc.content == "hello there"
+
+    def test_apply_edit_clears_redo(self):
+        """Test that a span edit clears redo history."""
+        doc = Document("abc")
+        doc.content = "abcd"
+        doc.undo()
+        doc.apply_edit(0, 1, "")
+        assert not doc.can_redo()
+        assert doc.content == "bc"
+
+    def test_apply_edit_invalid_span(self):
+        """Test that spans outside the content are rejected."""
+        doc = Document("abc")
+        with pytest.raises(ValueError):
+            doc.apply_edit(2, 1, "x")
+        with pytest.raises(ValueError):
+            doc.apply_edit(0, 4, "x")
+        assert doc.content == "abc"
+        assert not doc.can_undo()
+
 
 class TestDocumentClear:
     """Test Document clearing."""
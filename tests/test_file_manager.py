@@ -71,6 +71,23 @@ class TestFileManagerOpen:
         assert not doc.is_modified
         assert not doc.can_undo()
 
+    def test_open_file_normalizes_line_endings(self, temp_dir):
+        """Test that CRLF and CR line endings are read as LF."""
+        test_file = temp_dir / "crlf.txt"
+        test_file.write_bytes(b"one\r\ntwo\rthree\n")
+
+        doc = FileManager.open_file(test_file)
+        assert doc.content == "one\ntwo\nthree\n"
+
+    def test_open_large_file(self, temp_dir):
+        """Test opening a file large enough to be memory mapped."""
+        test_file = temp_dir / "large.txt"
+        content = "línea de texto\n" * 100000
+        test_file.write_text(content, encoding="utf-8")
+
+        doc = FileManager.open_file(test_file)
+        assert doc.content == content
+
 
 class TestFileManagerSave:
     """Test FileManager file saving functionality."""
@@ -139,6 +156,35 @@ class TestFileManagerSave:
 
         assert test_file.read_text(encoding="utf-8") == "new content"
 
+    def test_save_leaves_no_temporary_file(self, temp_dir):
+        """Test that the atomic save cleans up after itself."""
+        test_file = temp_dir / "test.txt"
+        FileManager.save_file(Document("content"), test_file)
+
+        assert [p.name for p in temp_dir.iterdir()] == ["test.txt"]
+
+    def test_save_preserves_file_mode(self, temp_dir):
+        """Test that overwriting keeps the existing file's permissions."""
+        test_file = temp_dir / "script.sh"
+        test_file.write_text("old", encoding="utf-8")
+        test_file.chmod(0o750)
+
+        FileManager.save_file(Document("new"), test_file)
+
+        assert test_file.stat().st_mode & 0o777 == 0o750
+
+    def test_save_through_symlink_updates_target(self, temp_dir):
+        """Test that saving to a symlink writes the file it points to."""
+        target = temp_dir / "target.txt"
+        target.write_text("old", encoding="utf-8")
+        link = temp_dir / "link.txt"
+        link.symlink_to(target)
+
+        FileManager.save_file(Document("new"), link)
+
+        assert link.is_symlink()
+        assert target.read_text(encoding="utf-8") == "new"
+
     def test_save_with_special_characters(self, temp_dir):
         """Test saving content with special characters."""
         content = "Special: éàü\nNewline\tTab"
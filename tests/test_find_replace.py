@@ -73,6 +73,23 @@ class TestFindAll:
         assert matches[1] == (1, 3)
         assert matches[2] == (2, 4)
 
+    def test_find_all_overlapping_with_border(self):
+        """Test overlapping matches for terms whose prefix equals their suffix."""
+        engine = FindReplaceEngine()
+
+        assert engine.find_all("ababa", "aba") == [(0, 3), (2, 5)]
+        assert engine.find_all("xAbAbAx", "aba") == [(1, 4), (3, 6)]
+        assert engine.find_all("abcabc", "abc") == [(0, 3), (3, 6)]
+        assert engine.find_all("ÄäÄä", "äÄ") == [(0, 2), (1, 3), (2, 4)]
+        assert engine.find_all("x" + "ab" * 300, "AB" * 200) == [(1 + 2 * i, 401 + 2 * i) for i in range(101)]
+
+    def test_find_all_whole_words_overlapping(self):
+        """Test that whole-word checks apply to each overlapping candidate."""
+        engine = FindReplaceEngine()
+        engine.set_whole_words(True)
+
+        assert engine.find_all("aa aaa aa", "aa") == [(0, 2), (7, 9)]
+
 
 class TestFindNext:
     """Test finding next occurrence."""
@@ -182,6 +199,29 @@ class TestFindPrevious:
         result = engine.find_previous(text, "hello", 17)
         assert result == (0, 5)
 
+    def test_find_previous_whole_word_checks_past_start(self):
+        """Test that a match ending at start_pos still needs a word boundary after it."""
+        engine = FindReplaceEngine()
+        engine.set_whole_words(True)
+        text = "cat cats"
+        result = engine.find_previous(text, "cat", 7)
+
+        assert result == (0, 3)
+
+    def test_find_previous_case_insensitive_overlapping(self):
+        """Test find previous returns the last overlapping match before start."""
+        engine = FindReplaceEngine()
+        text = "AaAa"
+        result = engine.find_previous(text, "aa", 3)
+
+        assert result == (1, 3)
+
+    def test_find_previous_negative_start(self):
+        """Test that a negative start position finds nothing."""
+        engine = FindReplaceEngine()
+        engine.set_case_sensitive(True)
+        assert engine.find_previous("hello hello", "hello", -1) is None
+
 
 class TestReplace:
     """Test replacing first occurrence."""
@@ -311,6 +351,91 @@ class TestReplaceAll:
         assert count == 2
 
 
+    def test_replace_all_replacement_is_literal(self):
+        """Test that backslashes in the replacement are not treated as escapes."""
+        engine = FindReplaceEngine()
+        modified, count = engine.replace_all("a.b.c", ".", r"\1\n")
+
+        assert modified == r"a\1\nb\1\nc"
+        assert count == 2
+
+    def test_replace_all_overlapping_left_to_right(self):
+        """Test that overlapping occurrences are replaced left to right."""
+        engine = FindReplaceEngine()
+        modified, count = engine.replace_all("aaaaa", "aa", "X")
+
+        assert modified == "XXa"
+        assert count == 2
+
+        engine.set_case_sensitive(True)
+        assert engine.replace_all("aaaaa", "aa", "X") == ("XXa", 2)
+
+
+    def test_replace_all_case_insensitive_keeps_other_text(self):
+        """Test that case-insensitive replace_all leaves unmatched text untouched."""
+        engine = FindReplaceEngine()
+        modified, count = engine.replace_all("Hello HELLO World", "hello", "hi")
+
+        assert modified == "hi hi World"
+        assert count == 2
+
+
+class TestLowercaseCache:
+    """Test reuse of the lowercased text for case-insensitive searches."""
+
+    def test_lowercase_text_reused(self):
+        """Test that repeated searches on the same text lowercase it once."""
+        engine = FindReplaceEngine()
+        text = "Hello World"
+
+        engine.find_all(text, "hello")
+        lowered = engine._lower_text
+        engine.find_next(text, "world", 0)
+
+        assert engine._lower_text is lowered
+
+    def test_invalidate_text_cache(self):
+        """Test that invalidating drops the cached lowercased text."""
+        engine = FindReplaceEngine()
+        engine.find_all("Hello", "hello")
+
+        engine.invalidate_text_cache()
+
+        assert engine._lower_source is None
+        assert engine.find_all("HELLO", "hello") == [(0, 5)]
+
+    def test_length_changing_lowercase_keeps_offsets(self):
+        """Test offsets when lowercasing would change the text length."""
+        engine = FindReplaceEngine()
+        text = "İx abc ABC"
+
+        assert engine.find_all(text, "abc") == [(3, 6), (7, 10)]
+
+    def test_case_folding_matches(self):
+        """Test that case-insensitive search compares case-folded text."""
+        engine = FindReplaceEngine()
+
+        assert engine.find_all("ΟΔΟΣ οδος", "οδοσ") == [(0, 4), (5, 9)]
+        assert engine.find_all("STRASSE Straße", "strasse") == [(0, 7)]
+
+    def test_set_document_precomputes_lowercase(self):
+        """Test that searches reuse the copy made by set_document."""
+        engine = FindReplaceEngine()
+        text = "Hello World"
+        engine.set_document(text)
+        lowered = engine._lower_text
+
+        assert engine.find_all("".join(["Hello", " World"]), "world") == [(6, 11)]
+        assert engine._lower_text is lowered
+
+    def test_set_document_replaced_by_new_text(self):
+        """Test that searching a different text rebuilds the copy."""
+        engine = FindReplaceEngine()
+        engine.set_document("Hello")
+
+        assert engine.find_all("HELLO hello", "hello") == [(0, 5), (6, 11)]
+
+
 class TestSettings:
     """Test engine settings."""
 
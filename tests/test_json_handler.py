@@ -1,6 +1,8 @@
 """Unit tests for JsonHandler."""
 
+import json
 import pytest
+from src import json_handler
 from src.json_handler import JsonHandler
 
 
@@ -44,6 +46,35 @@ class TestJsonValidation:
         assert JsonHandler.is_json('{"newline": "line1\\nline2"}')
         assert JsonHandler.is_json('{"tab": "col1\\tcol2"}')
 
+    def test_is_json_scalars_and_whitespace(self):
+        """Test top-level scalars and leading whitespace."""
+        for content in ['"text"', '-1', '0.5', 'true', 'false', 'null', '\n\t {"a": 1}']:
+            assert JsonHandler.is_json(content), content
+
+    def test_is_json_rejects_plain_text(self):
+        """Test that prose and code are not JSON."""
+        assert not JsonHandler.is_json('Hello world')
+        assert not JsonHandler.is_json('  def main():\n    pass')
+        assert not JsonHandler.is_json('\ufeff{"a": 1}')
+
+
+    def test_is_json_remembers_only_last_buffer(self, monkeypatch):
+        """Test that only the most recently checked buffer is kept."""
+        parses = []
+        real_loads = json_handler._loads
+        monkeypatch.setattr(json_handler, "_loads", lambda c: (parses.append(c), real_loads(c))[1])
+
+        first = '{"a": ' + "1}"
+        second = "[1, " + "2"
+        assert JsonHandler.is_json(first)
+        assert JsonHandler.is_json(first)
+        assert len(parses) == 1
+
+        assert not JsonHandler.is_json(second)
+        assert json_handler._last_checked == (second, False)
+        assert JsonHandler.is_json(first)
+        assert len(parses) == 3
+
 
 class TestJsonFormatting:
     """Test JSON formatting."""
@@ -311,3 +342,64 @@ class TestJsonEdgeCases:
         assert JsonHandler.is_json(json_str)
         formatted, success = JsonHandler.format_json(json_str)
         assert success
+
+    def test_non_standard_numbers(self):
+        """Test NaN and integers beyond 64 bits, which only the stdlib parser accepts."""
+        json_str = '{"nan": NaN, "big": 123456789012345678901234567890}'
+        assert JsonHandler.is_json(json_str)
+        assert JsonHandler.get_json_error(json_str) is None
+
+        formatted, success = JsonHandler.format_json(json_str)
+        assert success
+        assert formatted == '{\n  "nan": NaN,\n  "big": 123456789012345678901234567890\n}'
+
+        minified, success = JsonHandler.minify_json(json_str)
+        assert success
+        assert minified == '{"nan":NaN,"big":123456789012345678901234567890}'
+
+    def test_format_custom_indent(self):
+        """Test indentation other than two spaces."""
+        formatted, success = JsonHandler.format_json('{"a": [1]}', indent=4)
+        assert success
+        assert formatted == '{\n    "a": [\n        1\n    ]\n}'
+
+
+class TestJsonOrjsonBackend:
+    """Test the optional orjson fast path."""
+
+    def test_orjson_used_when_output_matches(self, monkeypatch, stub_orjson):
+        """Test that orjson formats text without floats or huge integers."""
+        monkeypatch.setattr(json_handler, "orjson", stub_orjson)
+
+        assert JsonHandler.minify_json('{"a": [1, "x"]}') == ('{"a":[1,"x"]}', True)
+        assert JsonHandler.format_json('{"a": 1}') == ('{\n  "a": 1\n}', True)
+        assert stub_orjson.calls == ["loads", "dumps", "loads", "dumps"]
+
+    def test_json_used_where_orjson_output_differs(self, monkeypatch, stub_orjson):
+        """Test that floats, huge integers and other indents bypass orjson."""
+        monkeypatch.setattr(json_handler, "orjson", stub_orjson)
+
+        assert JsonHandler.minify_json('[1.5e-7]') == ('[1.5e-07]', True)
+        assert JsonHandler.minify_json('[12345678901234567890]') == ('[12345678901234567890]', True)
+        assert JsonHandler.format_json('[1]', indent=4) == ('[\n    1\n]', True)
+        assert stub_orjson.calls == []
+
+    def test_orjson_rejections_fall_back(self, monkeypatch, stub_orjson):
+        """Test that text orjson rejects is handled by the json module."""
+        monkeypatch.setattr(json_handler, "orjson", stub_orjson)
+
+        assert JsonHandler.is_json('[NaN]')
+        assert JsonHandler.minify_json('[NaN, 1]') == ('[NaN,1]', True)
+        assert not JsonHandler.is_json('[1,')
+        assert "loads" in stub_orjson.calls
+
+    def test_real_orjson_matches_json_output(self):
+        """Test that output with orjson installed equals the json module's."""
+        pytest.importorskip("orjson")
+        content = '{"f": [1.5e-7, 1e100, 0.1], "i": [12345678901234567890123, -3], "s": "é\\u2028"}'
+        expected = json.dumps(json.loads(content), indent=2, ensure_ascii=False)
+        assert JsonHandler.format_json(content) == (expected, True)
+        assert JsonHandler.format_json('{"a": [true, null, "é"]}') == (
+            '{\n  "a": [\n    true,\n    null,\n    "é"\n  ]\n}',
+            True,
+        )
@@ -1,5 +1,7 @@
 """Unit tests for JsonTreeModel and JsonTreeNode."""
 
+import json
+import sys
 import pytest
 from src.json_tree_model import JsonTreeNode, JsonTreeModel
 
@@ -22,6 +24,13 @@ class TestJsonTreeNode:
         assert node.array_index == 0
         assert node.key is None
 
+    def test_node_has_no_instance_dict(self):
+        """Test that nodes use slots rather than a per-instance dict."""
+        node = JsonTreeNode(key="name", value="John")
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.unknown = 1
+
     def test_add_child(self):
         """Test adding a child node."""
         parent = JsonTreeNode(key="parent", value={})
@@ -77,6 +86,17 @@ class TestJsonTreeNode:
         assert "[2]" in text
         assert '"item"' in text
 
+    def test_display_text_shared_between_nodes(self):
+        """Test that identical container labels reuse one string."""
+        model = JsonTreeModel('[{"tags": ["a", "b"]}, {"tags": ["c", "d"]}]')
+
+        root = model.get_root()
+        assert root is not None
+        first = root.children[0].children[0].get_display_text()
+        second = root.children[1].children[0].get_display_text()
+        assert first == '"tags": Array (2 items)'
+        assert first is second
+
     def test_display_text_string_truncation(self):
         """Test display text truncates long strings."""
         long_string = "a" * 100
@@ -300,3 +320,85 @@ class TestJsonTreeModel:
         root = model.get_root()
         assert root is not None
         assert len(root.children) == 0
+
+    def test_deeply_nested_structure(self):
+        """Test building and collapsing nesting deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() * 2
+        data: list = []
+        for _ in range(depth):
+            data = [data]
+
+        root = JsonTreeModel._build_tree(data)
+        root.collapse_all()
+
+        node = root
+        for _ in range(depth):
+            assert node.is_expanded() is False
+            assert node.children[0].parent is node
+            assert node.children[0].array_index == 0
+            node = node.children[0]
+        assert node.children == []
+
+    def test_scalar_array_items_created_on_access(self):
+        """Test that arrays of scalars defer their item nodes."""
+        model = JsonTreeModel('{"ids": [1, 2, 3], "mixed": [1, {"a": 2}], "empty": []}')
+
+        root = model.get_root()
+        assert root is not None
+        ids, mixed, empty = root.children
+        assert ids._deferred is True
+        assert ids.is_expandable() is True
+        assert mixed._deferred is False
+        assert empty.is_expandable() is False
+
+        assert [child.value for child in ids.children] == [1, 2, 3]
+        assert [child.array_index for child in ids.children] == [0, 1, 2]
+        assert ids.children[0].parent is ids
+        assert ids._deferred is False
+
+    def test_deferred_items_follow_collapse_all(self):
+        """Test that deferred items created after collapse_all are collapsed."""
+        model = JsonTreeModel('{"ids": [1, 2]}')
+        model.collapse_all()
+
+        root = model.get_root()
+        assert root is not None
+        assert all(child.is_expanded() is False for child in root.children[0].children)
+
+    def test_parsed_containers_released(self):
+        """Test that the model keeps neither the source text nor parsed containers."""
+        model = JsonTreeModel('{"user": {"name": "John"}, "ids": [1, 2]}')
+
+        root = model.get_root()
+        assert root is not None
+        assert model.raw_json is None
+        assert not isinstance(root.value, dict)
+        assert root.value_type() is dict
+        user, ids = root.children
+        assert user.value_type() is dict
+        assert user.get_display_text() == '"user": Object (1 keys)'
+        assert ids.get_display_text() == '"ids": Array (2 items)'
+        assert ids.children[1].value == 2
+        assert ids.value_type() is list
+
+    def test_get_json_with_state_rebuilds_values(self):
+        """Test that summarized containers are rebuilt from their children."""
+        data = {"users": [{"name": "John", "tags": []}, {"name": "Jane", "tags": ["a"]}], "total": 2, "meta": {}}
+        model = JsonTreeModel(json.dumps(data))
+        # Create the items of one deferred array before converting back
+        jane_tags = model.get_root().children[0].children[1].children[1]
+        assert jane_tags.children[0].value == "a"
+
+        assert json.loads(model.get_json_with_state()) == data
+        assert model.get_json_with_state() == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_children_keep_source_order(self):
+        """Test that children follow the order of the parsed JSON."""
+        model = JsonTreeModel('{"b": [3, {"z": 1, "a": 2}], "a": null}')
+
+        root = model.get_root()
+        assert root is not None
+        assert [child.key for child in root.children] == ["b", "a"]
+        array_node = root.children[0]
+        assert [child.array_index for child in array_node.children] == [0, 1]
+        assert [child.key for child in array_node.children[1].children] == ["z", "a"]
@@ -0,0 +1,39 @@
+"""Unit tests for LineIndex."""
+
+from src.line_index import LineIndex
+
+
+class TestLineIndex:
+    """Test LineIndex lookups."""
+
+    def test_lines_match_split(self):
+        """Test that lines agree with str.split on newlines."""
+        for text in ["", "a", "a\n", "\n\n", "ab\ncd\n\nef", "x\r\ny"]:
+            index = LineIndex(text)
+            lines = text.split("\n")
+            assert len(index) == len(lines)
+            assert [index.line(i) for i in range(len(index))] == lines
+
+    def test_line_bounds(self):
+        """Test line start and end offsets."""
+        index = LineIndex("ab\n\ncde")
+        assert [index.line_start(i) for i in range(3)] == [0, 3, 4]
+        assert [index.line_end(i) for i in range(3)] == [2, 3, 7]
+
+    def test_line_and_column(self):
+        """Test converting offsets to line and column."""
+        index = LineIndex("ab\n\ncde")
+        assert index.line_and_column(0) == (0, 0)
+        assert index.line_and_column(2) == (0, 2)  # The newline ends line 0
+        assert index.line_and_column(3) == (1, 0)
+        assert index.line_and_column(6) == (2, 2)
+        assert index.line_at_offset(7) == 2
+
+    def test_lines_and_columns(self):
+        """Test batch conversion in ascending and arbitrary order."""
+        index = LineIndex("ab\n\ncde\nf")
+        offsets = [0, 2, 3, 4, 6, 8, 9]
+        expected = [index.line_and_column(offset) for offset in offsets]
+        assert index.lines_and_columns(offsets) == expected
+        assert index.lines_and_columns(offsets[::-1]) == expected[::-1]
+        assert index.lines_and_columns([]) == []
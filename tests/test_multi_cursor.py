@@ -30,6 +30,21 @@ class TestCursorPosition:
         assert pos2 < pos3
         assert not pos2 < pos1
 
+    def test_cursor_position_ordering(self):
+        """Test the derived ordering operators."""
+        pos1 = CursorPosition(5, 10)
+        pos2 = CursorPosition(5, 20)
+        assert pos1 <= pos2
+        assert pos1 <= CursorPosition(5, 10)
+        assert pos2 > pos1
+        assert pos2 >= pos1
+        assert sorted([CursorPosition(7, 0), pos2, pos1]) == [pos1, pos2, CursorPosition(7, 0)]
+
+    def test_cursor_position_has_slots(self):
+        """Test cursor positions do not carry a per-instance dict."""
+        pos = CursorPosition(1, 2)
+        assert not hasattr(pos, "__dict__")
+
     def test_cursor_position_hash(self):
         """Test cursor position is hashable."""
         pos1 = CursorPosition(5, 10)
@@ -77,6 +92,37 @@ class TestMultiCursorManager:
         manager.add_cursor(pos)
         assert manager.get_cursor_count() == 1
 
+    def test_no_duplicate_cursors_after_changes(self):
+        """Test the duplicate check after cursors are moved or removed."""
+        manager = MultiCursorManager()
+        manager.add_cursor(CursorPosition(5, 10))
+        manager.add_cursor(CursorPosition(6, 0))
+
+        manager.move_all_cursors(column_delta=1)
+        manager.add_cursor(CursorPosition(5, 11))
+        assert manager.get_cursor_count() == 2
+        manager.add_cursor(CursorPosition(5, 10))
+        assert manager.get_cursor_count() == 3
+
+        manager.remove_cursor(0)
+        manager.add_cursor(CursorPosition(5, 10))
+        assert manager.get_cursor_count() == 3
+
+    def test_no_duplicate_cursors_after_outside_moves(self):
+        """Test the duplicate check after a caller moves a cursor in place."""
+        manager = MultiCursorManager()
+        pos = CursorPosition(0, 0)
+        manager.add_cursor(pos)
+        pos.line = 5
+
+        manager.add_cursor(CursorPosition(0, 0))
+        manager.add_cursor(CursorPosition(5, 0))
+        assert manager.cursors == [CursorPosition(0, 0), CursorPosition(5, 0)]
+
+        manager.get_primary_cursor().column = 3
+        manager.add_cursor(CursorPosition(0, 3))
+        assert manager.get_cursor_count() == 2
+
     def test_remove_cursor(self):
         """Test removing a cursor."""
         manager = MultiCursorManager()
@@ -224,6 +270,21 @@ class TestMultiCursorManager:
         assert "hello! world" in result
         assert "hello! there" in result
 
+    def test_insert_at_several_cursors_per_line(self):
+        """Test inserting at several cursors on the same and later lines."""
+        manager = MultiCursorManager()
+        manager.cursors = [CursorPosition(2, 9), CursorPosition(0, 1), CursorPosition(0, 3)]
+        result = manager.insert_at_all_cursors("abcd\nskip\nef", "|")
+        assert result == "a|bc|d\nskip\nef|"
+        assert [(c.line, c.column) for c in manager.cursors] == [(2, 10), (0, 2), (0, 4)]
+
+    def test_delete_at_several_cursors_per_line(self):
+        """Test deleting at several cursors, ignoring those past the end of the text."""
+        manager = MultiCursorManager()
+        manager.cursors = [CursorPosition(0, 1), CursorPosition(0, 3), CursorPosition(1, 2), CursorPosition(5, 0)]
+        assert manager.delete_at_all_cursors("abcd\nef", delete_forward=False) == "bd\ne"
+        assert [(c.line, c.column) for c in manager.cursors] == [(0, 0), (0, 2), (1, 1), (5, 0)]
+
     def test_insert_at_all_cursors_empty_text(self):
         """Test inserting with no cursors."""
         manager = MultiCursorManager()
@@ -239,6 +300,17 @@ class TestMultiCursorManager:
         # Duplicates should already be prevented by add_cursor
         assert manager.get_cursor_count() == 1
 
+    def test_merge_overlapping_cursors_after_move(self):
+        """Test merging cursors that collide after being moved."""
+        manager = MultiCursorManager()
+        manager.add_cursor(CursorPosition(2, 0))
+        manager.add_cursor(CursorPosition(1, 1))
+        manager.add_cursor(CursorPosition(1, 3))
+        manager.add_cursor(CursorPosition(2, 2))
+        manager.move_all_cursors(column_delta=-2)
+        manager.merge_overlapping_cursors()
+        assert [(c.line, c.column) for c in manager.cursors] == [(1, 0), (1, 1), (2, 0)]
+
     def test_primary_cursor_adjustment_on_remove(self):
         """Test that primary cursor is adjusted when primary is removed."""
         manager = MultiCursorManager()
@@ -272,3 +344,20 @@ class TestMultiCursorManager:
         assert manager.cursors[0].column == 3
         assert manager.cursors[1].column == 7
         assert manager.cursors[2].column == 11
+
+    def test_select_all_occurrences_across_blank_lines(self):
+        """Test line and column tracking across empty and repeated lines."""
+        manager = MultiCursorManager()
+        text = "ab\n\n\nxab ab\naab"
+        manager.select_all_occurrences(text, "ab", case_sensitive=True)
+        positions = [(c.line, c.column) for c in manager.cursors]
+        assert positions == [(0, 2), (3, 3), (3, 6), (4, 3)]
+
+    def test_select_all_occurrences_case_insensitive_offsets(self):
+        """Test that case-insensitive columns index the original text."""
+        manager = MultiCursorManager()
+        # "İ".lower() is two characters long, which used to shift columns
+        text = "İ ab AB\nxAb"
+        manager.select_all_occurrences(text, "ab", case_sensitive=False)
+        positions = [(c.line, c.column) for c in manager.cursors]
+        assert positions == [(0, 4), (0, 7), (1, 3)]
@@ -0,0 +1,103 @@
+"""Unit tests for PieceTable text buffer."""
+
+import random
+import pytest
+from src.piece_table import PieceTable
+
+
+class TestPieceTableBasic:
+    """Test PieceTable construction and reads."""
+
+    def test_create_empty(self):
+        """Test creating an empty table."""
+        table = PieceTable()
+        assert table.text == ""
+        assert len(table) == 0
+
+    def test_create_with_text(self):
+        """Test creating a table with initial text."""
+        table = PieceTable("hello")
+        assert table.text == "hello"
+        assert len(table) == 5
+
+    def test_slice_without_join(self):
+        """Test slicing across pieces before the text is joined."""
+        table = PieceTable("hello world")
+        table.insert(5, ",")
+        table.delete(0, 1)
+
+        assert table.slice(0, 4) == "ello"
+        assert table.slice(3, 7) == "o, w"
+        assert table.slice(8, 100) == "rld"
+        assert table.slice(5, 5) == ""
+
+
+class TestPieceTableEdits:
+    """Test PieceTable insertions and deletions."""
+
+    def test_insert_start_middle_end(self):
+        """Test inserting at the start, middle and end."""
+        table = PieceTable("bd")
+        table.insert(0, "a")
+        table.insert(2, "c")
+        table.insert(4, "e")
+        assert table.text == "abcde"
+
+    def test_insert_into_empty(self):
+        """Test inserting into an empty table."""
+        table = PieceTable()
+        table.insert(0, "abc")
+        assert table.text == "abc"
+
+    def test_delete_across_pieces(self):
+        """Test deleting a span covering several pieces."""
+        table = PieceTable("abcdef")
+        table.insert(3, "XYZ")
+        table.delete(2, 7)
+        assert table.text == "abef"
+        assert len(table) == 4
+
+    def test_text_collapses_pieces(self):
+        """Test that reading the text merges pieces into one."""
+        table = PieceTable("abc")
+        table.insert(1, "x")
+        table.insert(3, "y")
+        assert table.text == "axbyc"
+        assert table._pieces == ["axbyc"]
+
+    def test_invalid_positions(self):
+        """Test that out-of-range edits are rejected."""
+        table = PieceTable("abc")
+        with pytest.raises(ValueError):
+            table.insert(4, "x")
+        with pytest.raises(ValueError):
+            table.delete(2, 1)
+        with pytest.raises(ValueError):
+            table.delete(0, 4)
+        assert table.text == "abc"
+
+    def test_random_edits_match_string(self):
+        """Test a random edit sequence against plain string slicing."""
+        rng = random.Random(0)
+        table = PieceTable("0123456789")
+        expected = "0123456789"
+
+        for _ in range(500):
+            start = rng.randint(0, len(expected))
+            if rng.random() < 0.5:
+                text = "".join(rng.choice("abc\n") for _ in range(rng.randint(1, 4)))
+                table.insert(start, text)
+                expected = expected[:start] + text + expected[start:]
+            else:
+                end = rng.randint(start, len(expected))
+                table.delete(start, end)
+                expected = expected[:start] + expected[end:]
+
+            a = rng.randint(0, len(expected))
+            b = rng.randint(a, len(expected))
+            assert table.slice(a, b) == expected[a:b]
+            assert len(table) == len(expected)
+            if rng.random() < 0.1:
+                assert table.text == expected
+
+        assert table.text == expected
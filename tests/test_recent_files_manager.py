@@ -3,6 +3,8 @@
 import pytest
 import tempfile
 import json
+import threading
+import time
 from pathlib import Path
 from src.recent_files_manager import RecentFilesManager
 
@@ -145,6 +147,35 @@ class TestRecentFilesManagerGetFiles:
         assert existing[0] == str(temp_files[2].resolve())
         assert existing[1] == str(temp_files[0].resolve())
 
+    def test_get_existing_recent_files_few_files(self, temp_config_dir, temp_files):
+        """Test the existence check with a short list."""
+        manager = RecentFilesManager(config_dir=temp_config_dir)
+        manager.add_file(temp_files[0])
+        manager.add_file(temp_files[1])
+
+        temp_files[0].unlink()
+
+        assert manager.get_existing_recent_files() == [str(temp_files[1].resolve())]
+
+    def test_get_existing_recent_files_slow_filesystem(self, temp_config_dir, monkeypatch):
+        """Test that checks after a slow one run concurrently and keep their order."""
+        manager = RecentFilesManager(config_dir=temp_config_dir)
+        paths = [f"/mnt/remote/file{i}.json" for i in range(6)]
+        manager._recent_files = list(paths)
+
+        threads = {}
+
+        def slow_exists(path):
+            threads[path] = threading.get_ident()
+            time.sleep(0.01)
+            return not path.endswith("3.json")
+
+        monkeypatch.setattr("src.recent_files_manager.os.path.exists", slow_exists)
+
+        assert manager.get_existing_recent_files() == [p for p in paths if not p.endswith("3.json")]
+        assert threads[paths[0]] == threading.get_ident()
+        assert all(threads[p] != threading.get_ident() for p in paths[1:])
+
 
 class TestRecentFilesManagerRemoveFile:
     """Test removing files."""
@@ -215,6 +246,30 @@ class TestRecentFilesManagerPersistence:
             assert "recent_files" in data
             assert len(data["recent_files"]) == 2
 
+    def test_unchanged_list_not_rewritten(self, temp_config_dir, temp_files, monkeypatch):
+        """Test that re-adding the most recent file does not write the config again."""
+        manager = RecentFilesManager(config_dir=temp_config_dir)
+        manager.add_file(temp_files[0])
+
+        writes = []
+        monkeypatch.setattr(
+            "src.recent_files_manager.FileManager.write_atomic", lambda path, data: writes.append(path)
+        )
+        manager.add_file(temp_files[0])
+        RecentFilesManager(config_dir=temp_config_dir).add_file(temp_files[0])
+        assert writes == []
+
+        manager.add_file(temp_files[1])
+        assert len(writes) == 1
+
+    def test_save_leaves_no_temporary_file(self, temp_config_dir, temp_files):
+        """Test that only the config file remains after saving."""
+        manager = RecentFilesManager(config_dir=temp_config_dir)
+        manager.add_file(temp_files[0])
+        manager.remove_file(temp_files[0])
+
+        assert [p.name for p in temp_config_dir.iterdir()] == ["recent_files.json"]
+
     def test_load_invalid_config_file(self, temp_config_dir):
         """Test loading with corrupted config file."""
         config_file = temp_config_dir / "recent_files.json"
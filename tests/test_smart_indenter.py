@@ -212,6 +212,14 @@ class TestBracketHandling:
         pos = indenter.find_matching_bracket(text, 0, "(")
         assert pos is None
 
+    def test_build_bracket_pairs(self):
+        """Test pairing brackets of each type independently."""
+        indenter = SmartIndenter()
+        assert indenter.build_bracket_pairs("{a[(b)]} ([)]") == {
+            0: 7, 2: 6, 3: 5, 9: 11, 10: 12
+        }
+        assert indenter.build_bracket_pairs(")(") == {}
+
     def test_get_bracket_completion(self):
         """Test getting bracket completion."""
         indenter = SmartIndenter()
@@ -246,6 +254,13 @@ class TestNormalization:
         result = indenter.normalize_indent(code, target_indent_size=4, use_spaces=True)
         assert "    " in result
 
+    def test_normalize_indent_exact(self):
+        """Test the exact output, including whitespace-only lines."""
+        code = "a\n  b\n    c\n   \n\t\td\n e"
+        indenter = SmartIndenter(indent_size=2)
+        result = indenter.normalize_indent(code, target_indent_size=4, use_spaces=True)
+        assert result == "a\n    b\n        c\n\n        d\ne"
+
 
 class TestSelectionIndent:
     """Test indenting selections."""
@@ -267,6 +282,11 @@ class TestSelectionIndent:
         assert lines[0] == "line1"
         assert lines[1] == "line2"
 
+    def test_indent_selection_increase_blank_lines(self):
+        """Test that every line, including blank ones, gets one indent level."""
+        indenter = SmartIndenter(indent_size=2)
+        assert indenter.indent_selection("a\n\n  b\n", increase=True) == "  a\n  \n    b\n  "
+
 
 class TestDocstring:
     """Test docstring formatting."""
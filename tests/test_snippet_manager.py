@@ -4,6 +4,8 @@ import pytest
 import json
 import tempfile
 from pathlib import Path
+from src.file_manager import FileManager
+from src import snippet_manager
 from src.snippet_manager import SnippetManager, Snippet
 
 
@@ -53,6 +55,11 @@ class TestSnippet:
         assert "name" in placeholders
         assert "age" in placeholders
 
+    def test_snippet_has_slots(self):
+        """Test snippets do not carry a per-instance dict."""
+        snippet = Snippet(name="test", title="Test", content="x")
+        assert not hasattr(snippet, "__dict__")
+
     def test_snippet_expand_basic(self):
         """Test expanding snippet without placeholders."""
         snippet = Snippet(name="test", title="Test", content="hello world")
@@ -81,6 +88,12 @@ class TestSnippet:
         assert "Bob" in expanded
         assert "${age}" in expanded
 
+    def test_snippet_expand_values_are_literal(self):
+        """Test that replacement values are not expanded again."""
+        snippet = Snippet(name="test", title="Test", content="${a} ${b}")
+        expanded = snippet.expand({"a": "${b}", "b": r"C:\new"})
+        assert expanded == r"${b} C:\new"
+
 
 class TestSnippetManagerBasic:
     """Test basic snippet manager functionality."""
@@ -254,6 +267,50 @@ class TestSnippetFiltering:
             tags = manager.get_tags()
             assert "python" in tags or len(tags) > 0
 
+    def test_filters_follow_added_and_removed_snippets(self):
+        """Test that language, tag and search lookups see snippet changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SnippetManager(tmpdir)
+            assert "cobol" not in manager.get_languages()
+            assert manager.get_snippets_by_tag("legacy") == []
+
+            custom = Snippet(
+                name="cobol_move",
+                title="MOVE",
+                content="MOVE ${a} TO ${b}.",
+                language="cobol",
+                tags=["legacy", "legacy"],
+            )
+            manager.add_snippet(custom)
+            assert "cobol" in manager.get_languages()
+            assert manager.get_snippets_by_tag("legacy") == [custom]
+            assert custom in manager.get_snippets_by_language("cobol")
+            assert manager.search_snippets("COBOL") == [custom]
+
+            manager.remove_snippet("cobol_move")
+            assert "cobol" not in manager.get_languages()
+            assert manager.search_snippets("cobol") == []
+            assert "legacy" not in manager.get_tags()
+
+    def test_lookups_follow_edits_stored_with_add_snippet(self):
+        """Test that lookups see a snippet edited in place once it is re-added."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SnippetManager(tmpdir)
+            snippet = Snippet(name="edited", title="Edited", content="x", language="python")
+            manager.add_snippet(snippet)
+            assert manager.get_snippets_by_tag("newtag") == []
+            assert manager.search_snippets("renamed") == []
+
+            snippet.language = "rust"
+            snippet.tags.append("newtag")
+            snippet.description = "Renamed"
+            manager.add_snippet(snippet)
+            assert snippet in manager.get_snippets_by_language("rust")
+            assert snippet not in manager.get_snippets_by_language("python")
+            assert manager.get_snippets_by_tag("newtag") == [snippet]
+            assert manager.search_snippets("renamed") == [snippet]
+            assert "rust" in manager.get_languages()
+
 
 class TestSnippetUsage:
     """Test snippet usage tracking."""
@@ -341,6 +398,53 @@ class TestSnippetPersistence:
             assert retrieved is not None
             assert retrieved.content == "persisted content"
 
+    def test_unchanged_file_parsed_once(self, monkeypatch):
+        """Test that managers share the parse of an unchanged snippets file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            SnippetManager(tmpdir).add_snippet(Snippet(name="shared", title="S", content="c", tags=["x"]))
+
+            parses = []
+            real_loads = snippet_manager._loads
+            monkeypatch.setattr(snippet_manager, "_loads", lambda data: parses.append(1) or real_loads(data))
+
+            manager1 = SnippetManager(tmpdir)
+            manager2 = SnippetManager(tmpdir)
+            assert len(parses) == 1
+            # Each manager still gets its own snippet objects
+            manager1.get_snippet("shared").tags.append("y")
+            assert manager2.get_snippet("shared").tags == ["x"]
+
+            manager1.add_snippet(Snippet(name="added", title="A", content="a"))
+            assert SnippetManager(tmpdir).get_snippet("added") is not None
+            assert len(parses) == 2
+
+    def test_save_and_load_non_ascii(self):
+        """Test that non-ASCII content survives the compact UTF-8 file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager1 = SnippetManager(tmpdir)
+            manager1.add_snippet(Snippet(name="unicode", title="Ünïcode", content="→ ${x} ✓"))
+
+            manager2 = SnippetManager(tmpdir)
+            assert manager2.get_snippet("unicode").content == "→ ${x} ✓"
+            assert manager2.get_snippet("unicode").title == "Ünïcode"
+
+    def test_load_skips_entries_with_bad_tags(self):
+        """Test that malformed tags skip only their entry when loading."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            entries = [
+                {"name": "good", "title": "Good", "content": "c", "tags": ["x"]},
+                {"name": "null_tags", "title": "Bad", "content": "c", "tags": None},
+                {"name": "number_tags", "title": "Bad", "content": "c", "tags": 3},
+                {"name": "string_tags", "title": "Bad", "content": "c", "tags": "ab"},
+            ]
+            (Path(tmpdir) / "snippets.json").write_text(json.dumps({"snippets": entries}))
+
+            manager = SnippetManager(tmpdir)
+            assert manager.get_snippet("good").tags == ["x"]
+            assert manager.get_snippet("null_tags") is None
+            assert manager.get_snippet("number_tags") is None
+            assert manager.get_snippet("string_tags") is None
+
     def test_custom_snippets_file_created(self):
         """Test that custom snippets file is created."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -355,6 +459,25 @@ class TestSnippetPersistence:
             snippets_file = Path(tmpdir) / "snippets.json"
             assert snippets_file.exists()
 
+    def test_snippet_round_trips_every_field(self):
+        """Test that serialization covers every Snippet field."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SnippetManager(tmpdir)
+            snippet = Snippet(
+                name="round_trip",
+                title="Round Trip",
+                content="${x}",
+                language="python",
+                description="desc",
+                shortcut="Ctrl+R",
+                tags=["a", "b"],
+                usage_count=3,
+                custom=True,
+            )
+            data = manager._snippet_to_dict(snippet)
+            assert set(data) == set(Snippet.__dataclass_fields__)
+            assert manager._dict_to_snippet(json.loads(json.dumps(data))) == snippet
+
 
 class TestSnippetExportImport:
     """Test snippet export and import."""
@@ -384,6 +507,19 @@ class TestSnippetExportImport:
             assert success
             assert export_file.exists()
 
+    def test_export_pretty(self):
+        """Test compact and indented exports hold the same data."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SnippetManager(tmpdir)
+            compact_file = Path(tmpdir) / "compact.json"
+            pretty_file = Path(tmpdir) / "pretty.json"
+            manager.export_snippets(str(compact_file), custom_only=False)
+            manager.export_snippets(str(pretty_file), custom_only=False, pretty=True)
+
+            assert "\n" not in compact_file.read_text()
+            assert "\n  " in pretty_file.read_text()
+            assert json.loads(compact_file.read_text()) == json.loads(pretty_file.read_text())
+
     def test_import_snippets(self):
         """Test importing snippets."""
         with tempfile.TemporaryDirectory() as tmpdir1:
@@ -406,6 +542,42 @@ class TestSnippetExportImport:
                 assert imported > 0
                 assert manager2.get_snippet("import_test") is not None
 
+    def test_import_saves_once(self, monkeypatch):
+        """Test that an import writes the snippets file once for the batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import_file = Path(tmpdir) / "import.json"
+            import_file.write_text(
+                json.dumps({"snippets": [{"name": f"s{i}", "title": "S", "content": "c"} for i in range(5)]})
+            )
+            manager = SnippetManager(tmpdir)
+
+            writes = []
+            real_write = FileManager.write_atomic
+            monkeypatch.setattr(
+                "src.snippet_manager.FileManager.write_atomic",
+                lambda path, data: (writes.append(path), real_write(path, data)),
+            )
+            assert manager.import_snippets(str(import_file)) == (5, 0)
+            assert len(writes) == 1
+            assert SnippetManager(tmpdir).get_snippet("s4") is not None
+
+    def test_import_skips_invalid_entries(self):
+        """Test that malformed entries are skipped and unknown keys ignored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import_file = Path(tmpdir) / "import.json"
+            entries = [
+                {"name": "good", "title": "Good", "content": "c", "extra": 1},
+                {"name": "no_content", "title": "Bad"},
+                {"name": "bad_time", "title": "Bad", "content": "c", "created_at": "yesterday"},
+                "not an object",
+            ]
+            import_file.write_text(json.dumps({"snippets": entries}))
+
+            manager = SnippetManager(tmpdir)
+            assert manager.import_snippets(str(import_file)) == (1, 3)
+            assert manager.get_snippet("good").content == "c"
+            assert manager.get_snippet("no_content") is None
+
     def test_import_with_overwrite(self):
         """Test importing with overwrite option."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -461,6 +633,36 @@ class TestSnippetStatistics:
             assert "builtin_snippets" in stats
             assert stats["total_snippets"] > 0
 
+    def test_usage_saves_are_batched(self, monkeypatch):
+        """Test that using custom snippets saves at most once per interval."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SnippetManager(tmpdir)
+            manager.add_snippet(Snippet(name="mine", title="Mine", content="x"))
+
+            writes = []
+            real_write = FileManager.write_atomic
+            monkeypatch.setattr(
+                "src.snippet_manager.FileManager.write_atomic",
+                lambda path, data: (writes.append(path), real_write(path, data)),
+            )
+            for _ in range(5):
+                manager.use_snippet("mine")
+            assert writes == []
+            assert SnippetManager(tmpdir).get_snippet("mine").usage_count == 0
+
+            manager.flush()
+            assert len(writes) == 1
+            assert SnippetManager(tmpdir).get_snippet("mine").usage_count == 5
+
+            manager.flush()
+            manager.use_snippet("py_if")  # Built-in usage is never saved
+            manager.flush()
+            assert len(writes) == 1
+
+            manager.USAGE_SAVE_INTERVAL = 0
+            manager.use_snippet("mine")
+            assert len(writes) == 2
+
     def test_clear_usage_stats(self):
         """Test clearing usage statistics."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -559,3 +761,49 @@ class TestEdgeCases:
             all_snippets = manager.get_all_snippets()
             assert len(all_snippets) >= 100
 
+
+
+class TestSnippetJsonBackend:
+    """Test the optional orjson fast path for snippet files."""
+
+    def test_orjson_reads_and_writes_snippets_file(self, monkeypatch, stub_orjson):
+        """Test that the snippets file goes through orjson when installed."""
+        monkeypatch.setattr(snippet_manager, "orjson", stub_orjson)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            SnippetManager(tmpdir).add_snippet(Snippet(name="fast", title="Fast", content="é"))
+            assert stub_orjson.calls == ["dumps"]
+
+            assert SnippetManager(tmpdir).get_snippet("fast").content == "é"
+            assert stub_orjson.calls == ["dumps", "loads"]
+
+    def test_pretty_export_uses_json(self, monkeypatch, stub_orjson):
+        """Test that indented exports always have the json module's layout."""
+        monkeypatch.setattr(snippet_manager, "orjson", stub_orjson)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = SnippetManager(tmpdir)
+            export_file = Path(tmpdir) / "export.json"
+            assert manager.export_snippets(str(export_file), custom_only=False, pretty=True)
+
+            data = json.loads(export_file.read_text(encoding="utf-8"))
+            assert export_file.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+            assert "dumps" not in stub_orjson.calls
+
+    def test_orjson_fallbacks(self, monkeypatch, stub_orjson):
+        """Test long integers and values orjson cannot encode use the json module."""
+        monkeypatch.setattr(snippet_manager, "orjson", stub_orjson)
+        assert snippet_manager._loads(b'{"n": 12345678901234567890123}') == {"n": 12345678901234567890123}
+        assert stub_orjson.calls == []
+
+        def refuse(data, option=None):
+            raise stub_orjson.JSONEncodeError("Integer exceeds 64-bit range")
+
+        monkeypatch.setattr(stub_orjson, "dumps", refuse)
+        assert snippet_manager._dumps({"n": 2**70}) == b'{"n":1180591620717411303424}'
+
+    def test_real_orjson_matches_json_output(self):
+        """Test that the snippets file is byte-identical with orjson installed."""
+        pytest.importorskip("orjson")
+        data = {"snippets": [{"name": "é", "tags": ["a ", "\t"], "usage_count": 2**63}], "version": "1.0"}
+        expected = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        assert snippet_manager._dumps(data) == expected
+        assert snippet_manager._loads(expected) == data
@@ -136,6 +136,23 @@ class TestTabManagerCloseTab:
         assert manager.get_document(0) is doc1
         assert manager.get_document(1) is doc3
 
+    def test_close_tab_before_active_keeps_document(self):
+        """Test that closing a tab left of the active one keeps it active."""
+        manager = TabManager()
+        doc1 = Document("1")
+        doc2 = Document("2")
+        doc3 = Document("3")
+
+        manager.add_tab(doc1)
+        manager.add_tab(doc2)
+        manager.add_tab(doc3)
+        manager.set_active_tab(1)
+
+        manager.close_tab(0)
+
+        assert manager.get_active_index() == 0
+        assert manager.get_active_document() is doc2
+
 
 class TestTabManagerSetActiveTab:
     """Test setting active tab."""
@@ -219,6 +236,17 @@ class TestTabManagerGetDocument:
         docs2 = manager.get_all_documents()
         assert len(docs2) == 1
 
+    def test_iter_documents(self):
+        """Test iterating over documents in tab order."""
+        manager = TabManager()
+        doc1 = Document("1")
+        doc2 = Document("2")
+        manager.add_tab(doc1)
+        manager.add_tab(doc2)
+
+        assert list(manager.iter_documents()) == [doc1, doc2]
+        assert list(TabManager().iter_documents()) == []
+
 
 class TestTabManagerUnsavedChanges:
     """Test unsaved changes detection."""
@@ -270,6 +298,36 @@ class TestTabManagerUnsavedChanges:
 
         assert manager.has_unsaved_changes()
 
+    def test_has_unsaved_changes_follows_documents(self):
+        """Test has_unsaved_changes through undo, save, close and clear."""
+        manager = TabManager()
+        doc1 = Document("1")
+        doc2 = Document("2")
+        doc2.content = "modified before adding"
+        manager.add_tab(doc1)
+        assert not manager.has_unsaved_changes()
+        manager.add_tab(doc2)
+        assert manager.has_unsaved_changes()
+
+        doc2.mark_saved()
+        assert not manager.has_unsaved_changes()
+
+        doc1.content = "changed"
+        doc1.undo()
+        assert not manager.has_unsaved_changes()
+
+        doc1.content = "changed"
+        manager.close_tab(0)
+        assert not manager.has_unsaved_changes()
+        # A closed document no longer counts
+        doc1.undo()
+        doc1.redo()
+        assert not manager.has_unsaved_changes()
+
+        doc2.content = "again"
+        manager.clear()
+        assert not manager.has_unsaved_changes()
+
 
 class TestTabManagerClear:
     """Test clearing tab manager."""
@@ -3,6 +3,7 @@
 import pytest
 import json
 import tempfile
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
 from src.theme_manager import ColorScheme, Theme, ThemeManager
 
@@ -126,6 +127,14 @@ class TestColorScheme:
         assert scheme.background == "#FFFFFF"
         assert scheme.foreground == "#000000"
 
+    def test_color_scheme_is_frozen(self):
+        """Test that shared color schemes cannot be modified in place."""
+        scheme = ThemeManager.LIGHT_THEME.colors
+        assert not hasattr(scheme, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            scheme.background = "#000000"
+        assert ColorScheme.from_dict(scheme.to_dict()) == scheme
+
 
 class TestTheme:
     """Test Theme."""
@@ -356,3 +365,18 @@ class TestThemeManager:
 
             assert light_theme.colors.background in stylesheet
             assert light_theme.colors.foreground in stylesheet
+
+    def test_stylesheet_cache_follows_colors(self):
+        """Test that cached stylesheets are reused and never go stale."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ThemeManager(Path(tmpdir))
+            first = manager.get_stylesheet()
+            assert manager.get_stylesheet() is first
+
+            colors = replace(manager.DARK_THEME.colors, background="#123456")
+            assert "#123456" in manager.get_stylesheet(Theme("Dark", "dark", colors))
+
+            colors = replace(colors, background="#654321")
+            stylesheet = manager.get_stylesheet(Theme("Dark", "dark", colors))
+            assert "#654321" in stylesheet
+            assert "#123456" not in stylesheet
@@ -205,6 +205,11 @@ class TestWhitespaceAnalyzer:
         text = "line1\nline2\nline3"
         assert WhitespaceAnalyzer.get_indent_size(text) == 4
 
+    def test_get_indent_size_ignores_blank_lines(self):
+        """Test that whitespace-only lines don't affect indent size."""
+        text = "line\n  a\n        \n  b\n        \n        "
+        assert WhitespaceAnalyzer.get_indent_size(text) == 2
+
 
 class TestVisualIndicatorRenderer:
     """Test VisualIndicatorRenderer."""